@@ -10,6 +10,8 @@ load_dotenv()
 class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./agentjobs.db"
+    db_read_pool_size: int = 4
+    db_read_cache_kb: int = 64000
     
     # Server
     host: str = "0.0.0.0"
@@ -20,6 +22,7 @@ class Settings(BaseSettings):
     api_prefix: str = "/api/v1"
     default_page_size: int = 20
     max_page_size: int = 100
+    max_search_offset: int = 1000
     
     # Rate Limiting
     free_rate_limit: int = 100
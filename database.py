@@ -1,9 +1,12 @@
 """Database setup and connection management for AgentJobs."""
 
 import aiosqlite
+import asyncio
 import os
 import json
+from contextlib import asynccontextmanager
 from config import settings
+from services.skills import normalize_skills
 
 DB_PATH = settings.database_url.replace("sqlite:///", "")
 if DB_PATH.startswith("./"):
@@ -23,9 +26,51 @@ async def get_db() -> aiosqlite.Connection:
     return _db
 
 
+# ── Read pool ───────────────────────────────────────────────────
+
+_read_pool = None
+_read_conns = []
+
+
+async def _open_reader() -> aiosqlite.Connection:
+    """Open a read-only connection with its own page cache."""
+    conn = await aiosqlite.connect(DB_PATH)
+    conn.row_factory = aiosqlite.Row
+    await conn.execute("PRAGMA query_only=ON")
+    await conn.execute(f"PRAGMA cache_size=-{settings.db_read_cache_kb}")
+    return conn
+
+
+@asynccontextmanager
+async def read_db():
+    """Borrow a pooled read-only connection (opened lazily, WAL lets them run alongside the writer)."""
+    global _read_pool
+    if DB_PATH == ":memory:":
+        # Separate connections would each see their own empty database
+        yield await get_db()
+        return
+    if _read_pool is None:
+        _read_pool = asyncio.Queue()
+        for _ in range(max(1, settings.db_read_pool_size)):
+            _read_pool.put_nowait(None)
+
+    conn = await _read_pool.get()
+    try:
+        if conn is None:
+            conn = await _open_reader()
+            _read_conns.append(conn)
+        yield conn
+    finally:
+        _read_pool.put_nowait(conn)
+
+
 async def close_db():
-    """Close database connection."""
-    global _db
+    """Close database connections."""
+    global _db, _read_pool
+    for conn in _read_conns:
+        await conn.close()
+    _read_conns.clear()
+    _read_pool = None
     if _db:
         await _db.close()
         _db = None
@@ -133,6 +178,18 @@ async def init_db():
             is_active BOOLEAN DEFAULT 1
         );
 
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+
+        -- One row per (skill, job), kept in sync with jobs.skills by the triggers below
+        CREATE TABLE IF NOT EXISTS job_skills (
+            skill TEXT NOT NULL,
+            job_id TEXT NOT NULL,
+            PRIMARY KEY (skill, job_id)
+        ) WITHOUT ROWID;
+
         CREATE TABLE IF NOT EXISTS user_activity (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             user_id TEXT REFERENCES users(id),
@@ -156,6 +213,9 @@ async def init_db():
         CREATE INDEX IF NOT EXISTS idx_jobs_posted_at ON jobs(posted_at);
         CREATE INDEX IF NOT EXISTS idx_jobs_is_active ON jobs(is_active);
         CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+        CREATE INDEX IF NOT EXISTS idx_jobs_category_nocase ON jobs(category COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_jobs_location_type_nocase ON jobs(location_type COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_jobs_employment_type_nocase ON jobs(employment_type COLLATE NOCASE);
         CREATE INDEX IF NOT EXISTS idx_api_keys_key_hash ON api_keys(key_hash);
         CREATE INDEX IF NOT EXISTS idx_api_usage_api_key_id ON api_usage(api_key_id);
         CREATE INDEX IF NOT EXISTS idx_api_usage_timestamp ON api_usage(timestamp);
@@ -164,6 +224,26 @@ async def init_db():
         CREATE INDEX IF NOT EXISTS idx_user_activity_timestamp ON user_activity(timestamp);
         CREATE INDEX IF NOT EXISTS idx_user_activity_action ON user_activity(action);
         CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
+        CREATE INDEX IF NOT EXISTS idx_job_skills_job_id ON job_skills(job_id);
+
+        -- INSERT OR REPLACE does not fire delete triggers, so inserts clear stale rows first
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_skills_insert AFTER INSERT ON jobs BEGIN
+            DELETE FROM job_skills WHERE job_id = NEW.id;
+            INSERT OR IGNORE INTO job_skills (skill, job_id)
+            SELECT value, NEW.id FROM json_each(CASE WHEN json_valid(NEW.skills) THEN NEW.skills ELSE '[]' END)
+            WHERE type = 'text';
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_skills_update AFTER UPDATE OF skills ON jobs BEGIN
+            DELETE FROM job_skills WHERE job_id = OLD.id;
+            INSERT OR IGNORE INTO job_skills (skill, job_id)
+            SELECT value, NEW.id FROM json_each(CASE WHEN json_valid(NEW.skills) THEN NEW.skills ELSE '[]' END)
+            WHERE type = 'text';
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_skills_delete AFTER DELETE ON jobs BEGIN
+            DELETE FROM job_skills WHERE job_id = OLD.id;
+        END;
     """)
 
     # Standalone FTS table (no content sync — we manage inserts ourselves)
@@ -187,7 +267,46 @@ async def init_db():
     except Exception:
         pass  # Column already exists
 
+    # Migration: store job skills in canonical form (runs once, tracked by user_version)
+    cursor = await db.execute("PRAGMA user_version")
+    migrated = False
+    if (await cursor.fetchone())[0] < 1:
+        migrated = await _normalize_job_skills(db)
+        await db.execute("PRAGMA user_version = 1")
+
+    # Migration: backfill job_skills for rows written before the triggers existed
+    cursor = await db.execute("PRAGMA user_version")
+    if (await cursor.fetchone())[0] < 2:
+        await db.execute("""
+            INSERT OR IGNORE INTO job_skills (skill, job_id)
+            SELECT je.value, j.id
+            FROM jobs j, json_each(CASE WHEN json_valid(j.skills) THEN j.skills ELSE '[]' END) je
+            WHERE je.type = 'text'
+        """)
+        await db.execute("PRAGMA user_version = 2")
+
     await db.commit()
+    if migrated:
+        await rebuild_fts()
+
+
+async def _normalize_job_skills(db) -> bool:
+    """Rewrite each job's skills JSON with normalized skill names. Returns True if any row changed."""
+    cursor = await db.execute("SELECT id, skills FROM jobs WHERE skills IS NOT NULL")
+    updates = []
+    for job_id, skills_json in await cursor.fetchall():
+        try:
+            skills = json.loads(skills_json)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        if not isinstance(skills, list):
+            continue
+        normalized = json.dumps(normalize_skills([str(s) for s in skills]))
+        if normalized != skills_json:
+            updates.append((normalized, job_id))
+    if updates:
+        await db.executemany("UPDATE jobs SET skills = ? WHERE id = ?", updates)
+    return bool(updates)
 
 
 async def rebuild_fts():
@@ -72,6 +72,7 @@ class JobListResponse(BaseModel):
     count: int
     total: int
     query_time_ms: float
+    next_cursor: Optional[str] = None
     jobs: List[JobSummary]
 
 
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Query, HTTPException
 from typing import Optional, List
-from services.search import search_jobs, get_job_by_id
+from services.search import search_jobs, get_job_by_id, SearchParamError
 from config import settings
 
 router = APIRouter(prefix="/api/v1", tags=["jobs"])
@@ -25,19 +25,23 @@ async def list_jobs(
     posted_after: Optional[str] = Query(None, description="ISO date filter"),
     sort: str = Query("relevance", description="Sort by: relevance, posted_at, salary"),
     limit: int = Query(20, ge=1, le=100, description="Results per page"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    offset: int = Query(0, ge=0, description="Pagination offset (capped; use cursor for deep pages)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (replaces offset)"),
 ):
     """Search and filter jobs. Optimized for AI agent consumption."""
     skills_list = [s.strip() for s in skills.split(",")] if skills else None
 
-    jobs, total, query_time = await search_jobs(
-        q=q, title=title, location=location, location_type=location_type,
-        company=company, skills=skills_list, salary_min=salary_min,
-        salary_max=salary_max, experience_min=experience_min,
-        experience_max=experience_max, category=category,
-        employment_type=employment_type, posted_after=posted_after,
-        sort=sort, limit=limit, offset=offset,
-    )
+    try:
+        jobs, total, query_time, next_cursor = await search_jobs(
+            q=q, title=title, location=location, location_type=location_type,
+            company=company, skills=skills_list, salary_min=salary_min,
+            salary_max=salary_max, experience_min=experience_min,
+            experience_max=experience_max, category=category,
+            employment_type=employment_type, posted_after=posted_after,
+            sort=sort, limit=limit, offset=offset, after_cursor=cursor,
+        )
+    except SearchParamError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # Strip full description from list view
     for job in jobs:
@@ -53,6 +57,7 @@ async def list_jobs(
         "count": len(jobs),
         "total": total,
         "query_time_ms": query_time,
+        "next_cursor": next_cursor,
         "jobs": jobs,
     }
 
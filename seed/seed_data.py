@@ -20,6 +20,8 @@ from datetime import datetime, timedelta
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database import get_db, init_db, rebuild_fts
+from services.search import invalidate_search_cache
+from services.skills import normalize_skills
 
 
 FALLBACK_COMPANIES = [
@@ -147,7 +149,7 @@ async def seed_database():
             short_desc, j["location"], "remote",
             sal_min, sal_max, sal_text,
             2, 5,
-            json.dumps(j["skills"]), j["category"], "full-time",
+            json.dumps(normalize_skills(j["skills"])), j["category"], "full-time",
             None,  # apply_url is NULL — no fake URLs!
             "seed", None,
             posted_at, True,
@@ -159,6 +161,7 @@ async def seed_database():
 
     print("Building search index...")
     await rebuild_fts()
+    invalidate_search_cache()
 
     cursor = await db.execute("SELECT COUNT(*) FROM jobs")
     j_count = (await cursor.fetchone())[0]
@@ -12,16 +12,22 @@ Every apply_url is verified before insertion. Dead links are skipped.
 
 import asyncio
 import hashlib
+import heapq
+import itertools
 import json
 import logging
 import os
 import re
-import uuid
+import secrets
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import aiohttp
 
+from services.skills import normalize_skills
+
 logger = logging.getLogger("agentjobs.fetcher")
 
 # ── Constants ────────────────────────────────────────────────────
@@ -31,8 +37,21 @@ EUR_TO_INR = 90
 GBP_TO_INR = 105
 
 CONCURRENCY_LIMIT = 15
+PARSE_WORKERS = 4  # one per API source
+VERIFY_PROGRESS_EVERY = 500
+SHORT_DESC_LEN = 200
+SHORT_DESC_SCAN = 1000  # HTML chars stripped before falling back to the full text
 API_TIMEOUT = aiohttp.ClientTimeout(total=15)
-VERIFY_TIMEOUT = aiohttp.ClientTimeout(total=5)
+# Per-socket limits rather than total: requests queue on the connector pool
+# (CONCURRENCY_LIMIT connections) and a total timeout would count that wait
+VERIFY_TIMEOUT = aiohttp.ClientTimeout(sock_connect=5, sock_read=5)
+
+# Applicant-tracking and job-board hosts whose apply links are trusted without
+# an HTTP check (subdomains included, e.g. boards.greenhouse.io)
+TRUSTED_APPLY_HOSTS = frozenset({
+    "greenhouse.io", "lever.co", "workable.com", "ashbyhq.com", "breezy.hr",
+    "smartrecruiters.com", "themuse.com", "remotive.com",
+})
 
 CATEGORY_KEYWORDS = {
     "engineering": [
@@ -114,13 +133,15 @@ KNOWN_SKILLS = [
 ]
 
 
-def _gen_id(prefix="j"):
-    return f"{prefix}_{uuid.uuid4().hex[:12]}"
+def _id_sequence(prefix="j"):
+    """IDs for one fetch run: a random per-run nonce plus a hex counter."""
+    nonce = secrets.token_hex(4)
+    return (f"{prefix}_{nonce}{n:08x}" for n in itertools.count())
 
 
 def _dedup_key(title, company, location):
-    raw = f"{title.lower().strip()}|{company.lower().strip()}|{(location or '').lower().strip()}"
-    return hashlib.md5(raw.encode()).hexdigest()
+    # Only used as an in-process dict key, so the normalized string is enough
+    return f"{title.lower().strip()}|{company.lower().strip()}|{(location or '').lower().strip()}"
 
 
 def _classify_category(title, tags=None):
@@ -141,44 +162,77 @@ AMBIGUOUS_SKILLS = {"react", "go", "r", "swift", "rust", "dart", "spark", "kafka
 # Cloud/infra terms that are unambiguous in tech context but can false-positive in non-tech jobs
 TECH_CONTEXT_SKILLS = {"aws", "azure", "gcp", "flask", "ansible", "terraform", "groovy"}
 TECH_CATEGORIES = {"engineering", "data-science", "design", "product"}
+# Tag substrings that mark a job as technical enough for TECH_CONTEXT_SKILLS
+TECH_HINT_KEYWORDS = ("software", "engineer", "developer", "devops", "cloud", "data", "backend",
+                      "frontend", "fullstack", "python", "java", "javascript", "node")
+
+# Multi-word spellings folded into their KNOWN_SKILLS form in one regex pass
+_DESC_NORMALIZE = {
+    "node.js": "nodejs",
+    "next.js": "nextjs",
+    "ruby on rails": "ruby-on-rails",
+    "spring boot": "spring-boot",
+}
+_DESC_NORMALIZE_RE = re.compile("|".join(re.escape(k) for k in _DESC_NORMALIZE))
 
 def _extract_skills(tags, description=""):
     found = set()
-    tag_text = " ".join(t if isinstance(t, str) else str(t) for t in tags).lower()
-    desc_text = (description or "").lower()
-    desc_text = desc_text.replace("node.js", "nodejs").replace("next.js", "nextjs")
-    desc_text = desc_text.replace("ruby on rails", "ruby-on-rails").replace("spring boot", "spring-boot")
+    tag_strs = [t if isinstance(t, str) else str(t) for t in tags]
+    tag_text = " ".join(tag_strs).lower()
+    desc_text = _DESC_NORMALIZE_RE.sub(lambda m: _DESC_NORMALIZE[m.group(0)], (description or "").lower())
+
+    # Normalize tags once: exact, space-to-dash and dashless forms
+    norm_tags = [t.lower().strip() for t in tag_strs]
+    tag_forms = set(norm_tags) | {t.replace(" ", "-") for t in norm_tags}
+    tag_dashless = {t.replace("-", "") for t in norm_tags}
+    tech_hints = any(kw in tag_text for kw in TECH_HINT_KEYWORDS)
 
     for skill in KNOWN_SKILLS:
         # First: exact tag match (most reliable)
-        tag_matched = False
-        for tag in tags:
-            tag_str = (tag if isinstance(tag, str) else str(tag)).lower().strip()
-            if tag_str == skill or tag_str.replace(" ", "-") == skill or tag_str.replace("-", "") == skill.replace("-", ""):
-                found.add(skill)
-                tag_matched = True
-                break
-        
-        if tag_matched:
+        if skill in tag_forms or skill.replace("-", "") in tag_dashless:
+            found.add(skill)
             continue
 
         # For ambiguous words: only match from tags, not description
         if skill in AMBIGUOUS_SKILLS:
             continue
-        
+
         # For tech-context skills: only match in description if tags suggest tech job
-        if skill in TECH_CONTEXT_SKILLS:
-            tag_lower = " ".join((t if isinstance(t, str) else str(t)).lower() for t in tags)
-            tech_hints = any(kw in tag_lower for kw in ["software", "engineer", "developer", "devops", "cloud", "data", "backend", "frontend", "fullstack", "python", "java", "javascript", "node"])
-            if not tech_hints:
-                continue
+        if skill in TECH_CONTEXT_SKILLS and not tech_hints:
+            continue
 
         # For unambiguous technical terms: search in description too
         pattern = r'\b' + re.escape(skill).replace(r'\-', r'[\-\s]?') + r'\b'
         if re.search(pattern, desc_text):
             found.add(skill)
 
-    return sorted(found)[:10]
+    return heapq.nsmallest(10, normalize_skills(found))
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _short_description(html):
+    """Strip tags and truncate, only scanning the head of long descriptions.
+
+    A literal "<" is text, not a tag, and is kept:
+
+    >>> _short_description("Salary < 50k, great team")
+    'Salary < 50k, great team'
+    >>> _short_description("Need 3<5 years exp and python")
+    'Need 3<5 years exp and python'
+    """
+    html = html or ""
+    head = html[:SHORT_DESC_SCAN]
+    if len(head) < len(html) and head.rfind("<") > head.rfind(">"):
+        # The slice ends inside a tag (or after a bare "<"); only the full
+        # strip can tell which, so take it
+        head = html
+    text = _TAG_RE.sub("", head)
+    if len(text) < SHORT_DESC_LEN and len(head) < len(html):
+        # Markup-heavy head: not enough text yet, strip the whole description
+        text = _TAG_RE.sub("", html)
+    return text[:SHORT_DESC_LEN].strip()
 
 
 def _normalize_location(loc):
@@ -249,9 +303,174 @@ def _get_experience_level_from_title(title):
     return 2, 5
 
 
+# ── Payload Parsers ──────────────────────────────────────────────
+# Pure functions over decoded JSON. They do all the regex/classification work
+# and run on worker processes so they don't stall the event loop.
+
+def _parse_remotive(data):
+    jobs = []
+    for item in data.get("jobs", []):
+        apply_url = item.get("url", "")
+        if not apply_url:
+            continue
+        tags = item.get("tags", []) or []
+        title = item.get("title", "")
+        company = item.get("company_name", "Unknown")
+        location = _normalize_location(item.get("candidate_required_location", ""))
+        salary_str = item.get("salary", "")
+        sal_min, sal_max = _parse_salary_to_monthly_inr(salary_str)
+        category = _classify_category(title, tags + [item.get("category", "")])
+        skills = _extract_skills(tags, item.get("description", ""))
+        exp_min, exp_max = _get_experience_level_from_title(title)
+        desc = item.get("description", "")
+        short = _short_description(desc)
+        job_type = (item.get("job_type", "") or "").lower().replace("_", "-")
+        if job_type not in ("full-time", "part-time", "contract", "internship"):
+            job_type = "full-time"
+
+        jobs.append({
+            "title": title, "company_name": company, "location": location,
+            "location_type": "remote", "salary_min": sal_min, "salary_max": sal_max,
+            "salary_text": salary_str or None, "experience_min": exp_min,
+            "experience_max": exp_max, "skills": skills, "category": category,
+            "employment_type": job_type, "apply_url": apply_url, "source": "remotive",
+            "source_id": str(item.get("id", "")), "posted_at": item.get("publication_date"),
+            "description": short, "description_short": short,
+        })
+    return jobs
+
+
+def _parse_jobicy(data):
+    jobs = []
+    for item in data.get("jobs", []):
+        apply_url = item.get("url", "")
+        if not apply_url:
+            continue
+        title = item.get("jobTitle", "")
+        company = item.get("companyName", "Unknown")
+        location = _normalize_location(item.get("jobGeo", ""))
+        industries = item.get("jobIndustry", []) or []
+        tags = industries if isinstance(industries, list) else [str(industries)]
+        job_types = item.get("jobType", []) or []
+        emp_type_raw = job_types[0] if isinstance(job_types, list) and job_types else "full-time"
+        emp_type = str(emp_type_raw).lower().replace(" ", "-")
+        if emp_type not in ("full-time", "part-time", "contract", "internship"):
+            emp_type = "full-time"
+
+        salary_str = ""
+        ann_min = item.get("annualSalaryMin")
+        ann_max = item.get("annualSalaryMax")
+        salary_currency = item.get("salaryCurrency", "USD")
+        if ann_min and ann_max:
+            salary_str = f"{salary_currency} {ann_min}-{ann_max}/year"
+        elif ann_min:
+            salary_str = f"{salary_currency} {ann_min}/year"
+        sal_min, sal_max = _parse_salary_to_monthly_inr(salary_str)
+
+        category = _classify_category(title, tags)
+        desc_text = item.get("jobExcerpt") or item.get("jobDescription") or ""
+        desc_text = _short_description(desc_text)
+        skills = _extract_skills(tags, desc_text)
+        exp_min, exp_max = _get_experience_level_from_title(title)
+
+        jobs.append({
+            "title": title, "company_name": company, "location": location,
+            "location_type": "remote", "salary_min": sal_min, "salary_max": sal_max,
+            "salary_text": salary_str or None, "experience_min": exp_min,
+            "experience_max": exp_max, "skills": skills, "category": category,
+            "employment_type": emp_type, "apply_url": apply_url, "source": "jobicy",
+            "source_id": str(item.get("id", "")), "posted_at": item.get("pubDate"),
+            "description": desc_text, "description_short": desc_text,
+        })
+    return jobs
+
+
+def _parse_themuse_page(data):
+    page_jobs = []
+    for item in data.get("results", []):
+        apply_url = (item.get("refs") or {}).get("landing_page", "")
+        if not apply_url:
+            continue
+        title = item.get("name", "")
+        company_data = item.get("company") or {}
+        company = company_data.get("name", "Unknown")
+        locations_list = item.get("locations", [])
+        loc_name = locations_list[0].get("name", "Remote") if locations_list else "Remote"
+        location = _normalize_location(loc_name)
+        categories = [c.get("name", "") for c in (item.get("categories") or [])]
+        levels = [l.get("name", "") for l in (item.get("levels") or [])]
+        tags = categories + levels
+        category = _classify_category(title, tags)
+        contents = item.get("contents", "")
+        desc_text = _short_description(contents)
+        skills = _extract_skills(tags, contents or "")
+        exp_min, exp_max = _get_experience_level_from_title(title)
+        loc_type = "onsite"
+        if "flexible" in loc_name.lower() or "remote" in loc_name.lower():
+            loc_type = "remote"
+        elif location == "Remote":
+            loc_type = "remote"
+
+        page_jobs.append({
+            "title": title, "company_name": company, "location": location,
+            "location_type": loc_type, "salary_min": None, "salary_max": None,
+            "salary_text": None, "experience_min": exp_min, "experience_max": exp_max,
+            "skills": skills, "category": category, "employment_type": "full-time",
+            "apply_url": apply_url, "source": "themuse",
+            "source_id": str(item.get("id", "")),
+            "posted_at": item.get("publication_date"),
+            "description": desc_text, "description_short": desc_text,
+        })
+    return page_jobs
+
+
+def _parse_arbeitnow(data):
+    jobs = []
+    for item in data.get("data", []):
+        apply_url = item.get("url", "")
+        if not apply_url:
+            continue
+        title = item.get("title", "")
+        company = item.get("company_name", "Unknown")
+        location = _normalize_location(item.get("location", ""))
+        tags = item.get("tags", []) or []
+        is_remote = item.get("remote", False)
+        loc_type = "remote" if is_remote else "onsite"
+        if is_remote and location != "Remote":
+            loc_type = "hybrid"
+        job_types = item.get("job_types", []) or []
+        emp_type = "full-time"
+        for jt in job_types:
+            jt_lower = (jt or "").lower().replace(" ", "-")
+            if jt_lower in ("full-time", "part-time", "contract", "internship"):
+                emp_type = jt_lower
+                break
+        category = _classify_category(title, tags)
+        desc_text = _short_description(item.get("description", ""))
+        skills = _extract_skills(tags, item.get("description", ""))
+        exp_min, exp_max = _get_experience_level_from_title(title)
+
+        jobs.append({
+            "title": title, "company_name": company, "location": location,
+            "location_type": loc_type, "salary_min": None, "salary_max": None,
+            "salary_text": None, "experience_min": exp_min, "experience_max": exp_max,
+            "skills": skills, "category": category, "employment_type": emp_type,
+            "apply_url": apply_url, "source": "arbeitnow",
+            "source_id": item.get("slug", ""), "posted_at": item.get("created_at"),
+            "description": desc_text, "description_short": desc_text,
+        })
+    return jobs
+
+
+async def _parse_in_pool(pool, parser, data):
+    """Run a payload parser on the process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, parser, data)
+
+
 # ── API Fetchers ─────────────────────────────────────────────────
 
-async def _fetch_remotive(session):
+async def _fetch_remotive(session, pool):
     jobs = []
     try:
         url = "https://remotive.com/api/remote-jobs?limit=100"
@@ -261,41 +480,14 @@ async def _fetch_remotive(session):
                 return []
             data = await resp.json()
 
-        for item in data.get("jobs", []):
-            apply_url = item.get("url", "")
-            if not apply_url:
-                continue
-            tags = item.get("tags", []) or []
-            title = item.get("title", "")
-            company = item.get("company_name", "Unknown")
-            location = _normalize_location(item.get("candidate_required_location", ""))
-            salary_str = item.get("salary", "")
-            sal_min, sal_max = _parse_salary_to_monthly_inr(salary_str)
-            category = _classify_category(title, tags + [item.get("category", "")])
-            skills = _extract_skills(tags, item.get("description", ""))
-            exp_min, exp_max = _get_experience_level_from_title(title)
-            desc = item.get("description", "")
-            short = re.sub(r'<[^>]+>', '', desc or "")[:200].strip()
-            job_type = (item.get("job_type", "") or "").lower().replace("_", "-")
-            if job_type not in ("full-time", "part-time", "contract", "internship"):
-                job_type = "full-time"
-
-            jobs.append({
-                "title": title, "company_name": company, "location": location,
-                "location_type": "remote", "salary_min": sal_min, "salary_max": sal_max,
-                "salary_text": salary_str or None, "experience_min": exp_min,
-                "experience_max": exp_max, "skills": skills, "category": category,
-                "employment_type": job_type, "apply_url": apply_url, "source": "remotive",
-                "source_id": str(item.get("id", "")), "posted_at": item.get("publication_date"),
-                "description": short, "description_short": short,
-            })
+        jobs = await _parse_in_pool(pool, _parse_remotive, data)
         logger.info(f"Remotive: fetched {len(jobs)} jobs")
     except Exception as e:
         logger.error(f"Remotive fetch error: {e}")
     return jobs
 
 
-async def _fetch_jobicy(session):
+async def _fetch_jobicy(session, pool):
     jobs = []
     try:
         url = "https://jobicy.com/api/v2/remote-jobs?count=50"
@@ -305,53 +497,14 @@ async def _fetch_jobicy(session):
                 return []
             data = await resp.json()
 
-        for item in data.get("jobs", []):
-            apply_url = item.get("url", "")
-            if not apply_url:
-                continue
-            title = item.get("jobTitle", "")
-            company = item.get("companyName", "Unknown")
-            location = _normalize_location(item.get("jobGeo", ""))
-            industries = item.get("jobIndustry", []) or []
-            tags = industries if isinstance(industries, list) else [str(industries)]
-            job_types = item.get("jobType", []) or []
-            emp_type_raw = job_types[0] if isinstance(job_types, list) and job_types else "full-time"
-            emp_type = str(emp_type_raw).lower().replace(" ", "-")
-            if emp_type not in ("full-time", "part-time", "contract", "internship"):
-                emp_type = "full-time"
-
-            salary_str = ""
-            ann_min = item.get("annualSalaryMin")
-            ann_max = item.get("annualSalaryMax")
-            salary_currency = item.get("salaryCurrency", "USD")
-            if ann_min and ann_max:
-                salary_str = f"{salary_currency} {ann_min}-{ann_max}/year"
-            elif ann_min:
-                salary_str = f"{salary_currency} {ann_min}/year"
-            sal_min, sal_max = _parse_salary_to_monthly_inr(salary_str)
-
-            category = _classify_category(title, tags)
-            desc_text = item.get("jobExcerpt") or item.get("jobDescription") or ""
-            desc_text = re.sub(r'<[^>]+>', '', desc_text)[:200].strip()
-            skills = _extract_skills(tags, desc_text)
-            exp_min, exp_max = _get_experience_level_from_title(title)
-
-            jobs.append({
-                "title": title, "company_name": company, "location": location,
-                "location_type": "remote", "salary_min": sal_min, "salary_max": sal_max,
-                "salary_text": salary_str or None, "experience_min": exp_min,
-                "experience_max": exp_max, "skills": skills, "category": category,
-                "employment_type": emp_type, "apply_url": apply_url, "source": "jobicy",
-                "source_id": str(item.get("id", "")), "posted_at": item.get("pubDate"),
-                "description": desc_text, "description_short": desc_text,
-            })
+        jobs = await _parse_in_pool(pool, _parse_jobicy, data)
         logger.info(f"Jobicy: fetched {len(jobs)} jobs")
     except Exception as e:
         logger.error(f"Jobicy fetch error: {e}")
     return jobs
 
 
-async def _fetch_themuse(session):
+async def _fetch_themuse(session, pool):
     jobs = []
     pages_to_fetch = list(range(1, 26))
 
@@ -363,40 +516,7 @@ async def _fetch_themuse(session):
                 if resp.status != 200:
                     return []
                 data = await resp.json()
-            for item in data.get("results", []):
-                apply_url = (item.get("refs") or {}).get("landing_page", "")
-                if not apply_url:
-                    continue
-                title = item.get("name", "")
-                company_data = item.get("company") or {}
-                company = company_data.get("name", "Unknown")
-                locations_list = item.get("locations", [])
-                loc_name = locations_list[0].get("name", "Remote") if locations_list else "Remote"
-                location = _normalize_location(loc_name)
-                categories = [c.get("name", "") for c in (item.get("categories") or [])]
-                levels = [l.get("name", "") for l in (item.get("levels") or [])]
-                tags = categories + levels
-                category = _classify_category(title, tags)
-                contents = item.get("contents", "")
-                desc_text = re.sub(r'<[^>]+>', '', contents or "")[:200].strip()
-                skills = _extract_skills(tags, contents or "")
-                exp_min, exp_max = _get_experience_level_from_title(title)
-                loc_type = "onsite"
-                if "flexible" in loc_name.lower() or "remote" in loc_name.lower():
-                    loc_type = "remote"
-                elif location == "Remote":
-                    loc_type = "remote"
-
-                page_jobs.append({
-                    "title": title, "company_name": company, "location": location,
-                    "location_type": loc_type, "salary_min": None, "salary_max": None,
-                    "salary_text": None, "experience_min": exp_min, "experience_max": exp_max,
-                    "skills": skills, "category": category, "employment_type": "full-time",
-                    "apply_url": apply_url, "source": "themuse",
-                    "source_id": str(item.get("id", "")),
-                    "posted_at": item.get("publication_date"),
-                    "description": desc_text, "description_short": desc_text,
-                })
+            page_jobs = await _parse_in_pool(pool, _parse_themuse_page, data)
         except Exception as e:
             logger.error(f"The Muse page {page} error: {e}")
         return page_jobs
@@ -413,7 +533,7 @@ async def _fetch_themuse(session):
     return jobs
 
 
-async def _fetch_arbeitnow(session):
+async def _fetch_arbeitnow(session, pool):
     jobs = []
     try:
         url = "https://www.arbeitnow.com/api/job-board-api"
@@ -423,39 +543,7 @@ async def _fetch_arbeitnow(session):
                 return []
             data = await resp.json()
 
-        for item in data.get("data", []):
-            apply_url = item.get("url", "")
-            if not apply_url:
-                continue
-            title = item.get("title", "")
-            company = item.get("company_name", "Unknown")
-            location = _normalize_location(item.get("location", ""))
-            tags = item.get("tags", []) or []
-            is_remote = item.get("remote", False)
-            loc_type = "remote" if is_remote else "onsite"
-            if is_remote and location != "Remote":
-                loc_type = "hybrid"
-            job_types = item.get("job_types", []) or []
-            emp_type = "full-time"
-            for jt in job_types:
-                jt_lower = (jt or "").lower().replace(" ", "-")
-                if jt_lower in ("full-time", "part-time", "contract", "internship"):
-                    emp_type = jt_lower
-                    break
-            category = _classify_category(title, tags)
-            desc_text = re.sub(r'<[^>]+>', '', item.get("description", "") or "")[:200].strip()
-            skills = _extract_skills(tags, item.get("description", ""))
-            exp_min, exp_max = _get_experience_level_from_title(title)
-
-            jobs.append({
-                "title": title, "company_name": company, "location": location,
-                "location_type": loc_type, "salary_min": None, "salary_max": None,
-                "salary_text": None, "experience_min": exp_min, "experience_max": exp_max,
-                "skills": skills, "category": category, "employment_type": emp_type,
-                "apply_url": apply_url, "source": "arbeitnow",
-                "source_id": item.get("slug", ""), "posted_at": item.get("created_at"),
-                "description": desc_text, "description_short": desc_text,
-            })
+        jobs = await _parse_in_pool(pool, _parse_arbeitnow, data)
         logger.info(f"Arbeitnow: fetched {len(jobs)} jobs")
     except Exception as e:
         logger.error(f"Arbeitnow fetch error: {e}")
@@ -464,39 +552,53 @@ async def _fetch_arbeitnow(session):
 
 # ── URL Verification ─────────────────────────────────────────────
 
-async def _verify_urls(session, jobs):
+def _is_trusted_url(url):
+    host = (urlsplit(url).hostname or "").lower()
+    return any(host == h or host.endswith("." + h) for h in TRUSTED_APPLY_HOSTS)
+
+
+async def _verify_urls(session, jobs, now_iso):
     """Verify apply_url for each job. Returns only jobs with working URLs."""
     verified = []
-    sem = asyncio.Semaphore(CONCURRENCY_LIMIT)
-    now_iso = datetime.now(timezone.utc).isoformat()
 
+    # Concurrency is bounded by the session's connector (limit=CONCURRENCY_LIMIT)
     async def check_one(job):
         url = job.get("apply_url", "")
         if not url:
             return None
-        async with sem:
-            try:
-                async with session.head(url, timeout=VERIFY_TIMEOUT,
-                                        allow_redirects=True, ssl=False) as resp:
-                    if resp.status < 400:
-                        job["verified_at"] = now_iso
-                        return job
-            except Exception:
-                pass
-            try:
-                async with session.get(url, timeout=VERIFY_TIMEOUT,
-                                       allow_redirects=True, ssl=False) as resp:
-                    if resp.status < 400:
-                        job["verified_at"] = now_iso
-                        return job
-            except Exception:
-                pass
+        if _is_trusted_url(url):
+            job["verified_at"] = now_iso
+            return job
+        try:
+            async with session.head(url, timeout=VERIFY_TIMEOUT,
+                                    allow_redirects=True, ssl=False) as resp:
+                if resp.status < 400:
+                    job["verified_at"] = now_iso
+                    return job
+        except Exception:
+            pass
+        try:
+            async with session.get(url, timeout=VERIFY_TIMEOUT,
+                                   allow_redirects=True, ssl=False) as resp:
+                if resp.status < 400:
+                    job["verified_at"] = now_iso
+                    return job
+        except Exception:
+            pass
         return None
 
-    results = await asyncio.gather(*[check_one(j) for j in jobs], return_exceptions=True)
-    for r in results:
+    # Consume checks as they finish instead of materializing every result at once
+    done = 0
+    for fut in asyncio.as_completed([check_one(j) for j in jobs]):
+        try:
+            r = await fut
+        except Exception:
+            r = None
         if isinstance(r, dict):
             verified.append(r)
+        done += 1
+        if done % VERIFY_PROGRESS_EVERY == 0:
+            logger.info(f"URL verification: {done}/{len(jobs)} checked, {len(verified)} passed")
 
     logger.info(f"URL verification: {len(verified)}/{len(jobs)} passed")
     return verified
@@ -514,8 +616,10 @@ async def fetch_real_jobs():
         return 0
 
     from database import get_db, rebuild_fts
+    from services.search import invalidate_search_cache
 
     logger.info("Starting real job fetch from public APIs...")
+    now_iso = datetime.now(timezone.utc).isoformat()
 
     headers = {
         "User-Agent": "AgentJobs/1.0 (job aggregator; contact@agentjobs.dev)",
@@ -523,14 +627,16 @@ async def fetch_real_jobs():
 
     all_jobs = []
 
-    async with aiohttp.ClientSession(headers=headers) as session:
-        results = await asyncio.gather(
-            _fetch_remotive(session),
-            _fetch_jobicy(session),
-            _fetch_themuse(session),
-            _fetch_arbeitnow(session),
-            return_exceptions=True,
-        )
+    connector = aiohttp.TCPConnector(limit=CONCURRENCY_LIMIT, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+        with ProcessPoolExecutor(max_workers=PARSE_WORKERS) as pool:
+            results = await asyncio.gather(
+                _fetch_remotive(session, pool),
+                _fetch_jobicy(session, pool),
+                _fetch_themuse(session, pool),
+                _fetch_arbeitnow(session, pool),
+                return_exceptions=True,
+            )
 
         source_counts = {}
         for r in results:
@@ -563,7 +669,7 @@ async def fetch_real_jobs():
 
         # Verify URLs
         logger.info("Verifying apply URLs...")
-        verified_jobs = await _verify_urls(session, unique_jobs)
+        verified_jobs = await _verify_urls(session, unique_jobs, now_iso)
 
     if not verified_jobs:
         logger.warning("No jobs passed URL verification. Will use fallback seed.")
@@ -578,57 +684,57 @@ async def fetch_real_jobs():
         cname = job["company_name"]
         cname_lower = cname.lower().strip()
         if cname_lower not in company_map:
-            cid = f"c_{hashlib.md5(cname_lower.encode()).hexdigest()[:12]}"
+            cid = f"c_{hashlib.blake2b(cname_lower.encode(), digest_size=6).hexdigest()}"
             company_map[cname_lower] = {"id": cid, "name": cname}
 
-    # Insert companies
-    for cdata in company_map.values():
-        await db.execute("""
-            INSERT OR IGNORE INTO companies (id, name, created_at)
-            VALUES (?, ?, ?)
-        """, (cdata["id"], cdata["name"], datetime.now(timezone.utc).isoformat()))
-
-    logger.info(f"Inserted {len(company_map)} companies")
+    # Insert companies and jobs as two batched statements; sqlite3 opens the
+    # transaction implicitly on the first INSERT and the commit closes it.
+    company_rows = [(cdata["id"], cdata["name"], now_iso) for cdata in company_map.values()]
 
-    # Insert jobs
-    inserted = 0
+    job_ids = _id_sequence("j")
+    job_rows = []
     for job in verified_jobs:
         cname_lower = job["company_name"].lower().strip()
-        company_id = company_map[cname_lower]["id"]
-        job_id = _gen_id("j")
-        skills_json = json.dumps(job.get("skills", []))
-        verified_at = job.get("verified_at")
+        job_rows.append((
+            next(job_ids), company_map[cname_lower]["id"], job["title"], job.get("description"),
+            job.get("description_short"), job.get("location"),
+            job.get("location_type"), job.get("salary_min"),
+            job.get("salary_max"), job.get("salary_text"),
+            job.get("experience_min"), job.get("experience_max"),
+            json.dumps(job.get("skills", [])), job.get("category"), job.get("employment_type"),
+            job["apply_url"], job.get("source"), job.get("source_id"),
+            job.get("posted_at"), True, job.get("verified_at"),
+            json.dumps({"source": job.get("source")}),
+        ))
 
-        try:
-            await db.execute("""
-                INSERT OR IGNORE INTO jobs
-                (id, company_id, title, description, description_short, location,
-                 location_type, salary_min, salary_max, salary_text,
-                 experience_min, experience_max, skills, category,
-                 employment_type, apply_url, source, source_id,
-                 posted_at, is_active, verified_at, raw_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job_id, company_id, job["title"], job.get("description"),
-                job.get("description_short"), job.get("location"),
-                job.get("location_type"), job.get("salary_min"),
-                job.get("salary_max"), job.get("salary_text"),
-                job.get("experience_min"), job.get("experience_max"),
-                skills_json, job.get("category"), job.get("employment_type"),
-                job["apply_url"], job.get("source"), job.get("source_id"),
-                job.get("posted_at"), True, verified_at,
-                json.dumps({"source": job.get("source")}),
-            ))
-            inserted += 1
-        except Exception as e:
-            logger.error(f"Insert error for '{job['title']}': {e}")
+    try:
+        await db.executemany("""
+            INSERT OR IGNORE INTO companies (id, name, created_at)
+            VALUES (?, ?, ?)
+        """, company_rows)
+        cursor = await db.executemany("""
+            INSERT OR IGNORE INTO jobs
+            (id, company_id, title, description, description_short, location,
+             location_type, salary_min, salary_max, salary_text,
+             experience_min, experience_max, skills, category,
+             employment_type, apply_url, source, source_id,
+             posted_at, is_active, verified_at, raw_data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, job_rows)
+        inserted = cursor.rowcount
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Batch insert error: {e}")
+        return 0
 
-    await db.commit()
+    logger.info(f"Inserted {len(company_rows)} companies")
     logger.info(f"Inserted {inserted} verified jobs into database")
 
     # Rebuild FTS index
     logger.info("Rebuilding FTS index...")
     await rebuild_fts()
+    invalidate_search_cache()
 
     logger.info("Job fetch complete!")
     return inserted
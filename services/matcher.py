@@ -1,11 +1,14 @@
 """Resume-job matching algorithm for AgentJobs."""
 
-import json
+import asyncio
+import heapq
+import orjson
 import time
-from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain
 from typing import List, Optional
 from database import get_db
-from services.skills import normalize_skill, normalize_skills, extract_skills_from_text, skills_match_details
+from services.skills import normalize_skill, extract_skills_from_text, job_skills_to_mask, skills_to_mask
 
 
 # Location groupings (city -> state)
@@ -28,6 +31,7 @@ LOCATION_STATES = {
 }
 
 
+@lru_cache(maxsize=4096)
 def _get_state(location: str) -> Optional[str]:
     """Get state/region from a location string."""
     if not location:
@@ -39,29 +43,41 @@ def _get_state(location: str) -> Optional[str]:
     return None
 
 
-def _score_skills(candidate_skills: List[str], job_skills: List[str]) -> tuple:
-    """Score skills match (0-40 points). Returns (score, matched, missing)."""
-    if not job_skills:
-        if candidate_skills:
-            return 0, [], []  # Job has no skill data, can't match — no free points
-        return 10, [], []  # Neither side has skills, small partial credit
+@lru_cache(maxsize=8192)
+def _parse_job_skills(skills_json: str) -> tuple:
+    """Parse a job's (already normalized) skills JSON into (skill set, skill mask, raw skill count)."""
+    try:
+        job_skills = orjson.loads(skills_json)
+    except (orjson.JSONDecodeError, TypeError):
+        job_skills = []
+    j_set = frozenset(job_skills)
+    return j_set, job_skills_to_mask(j_set), len(job_skills)
+
+
+def _score_skills(c_has_skills: bool, c_mask: int, j_mask: int, j_size: int) -> int:
+    """Score skills match (0-40 points) from skill bitmasks.
 
-    c_set = set(normalize_skill(s) for s in candidate_skills)
-    j_set = set(normalize_skill(s) for s in job_skills)
+    c_has_skills is passed separately because the candidate mask leaves out
+    skills no job carries, so it can be 0 for a candidate who has skills.
+    """
+    if not j_size:
+        if c_has_skills:
+            return 0  # Job has no skill data, can't match — no free points
+        return 10  # Neither side has skills, small partial credit
 
-    matched = c_set & j_set
-    missing = j_set - c_set
+    match_pct = (c_mask & j_mask).bit_count() / j_size
+    return int(match_pct * 40)
 
-    if not j_set:
-        return 20, list(matched), list(missing)
 
-    match_pct = len(matched) / len(j_set)
-    score = int(match_pct * 40)
+REMOTE_KEYWORDS = ("remote", "anywhere", "worldwide", "global", "flexible")
 
-    return score, sorted(list(matched)), sorted(list(missing))
 
+def _candidate_locations(locations: List[str]) -> tuple:
+    """Lowercase the candidate's preferred locations and resolve each one's state once."""
+    return tuple((loc.lower().strip(), _get_state(loc)) for loc in locations)
 
-def _score_location(candidate_locations: List[str], job_location: Optional[str], job_location_type: Optional[str]) -> tuple:
+
+def _score_location(candidates: tuple, job_location: Optional[str], job_location_type: Optional[str]) -> tuple:
     """Score location match (0-20 points). Returns (score, reason)."""
     job_loc = (job_location or "").lower().strip()
 
@@ -73,92 +89,208 @@ def _score_location(candidate_locations: List[str], job_location: Optional[str],
         return 20, "Location: Remote position — available anywhere"
     
     # Check if job location text indicates remote
-    remote_keywords = ["remote", "anywhere", "worldwide", "global", "flexible"]
-    if any(kw in job_loc for kw in remote_keywords):
+    if any(kw in job_loc for kw in REMOTE_KEYWORDS):
         return 18, "Location: Remote/flexible position"
 
-    if not candidate_locations:
+    if not candidates:
         return 10, "Location: No preference specified"
 
-    candidate_locs = [loc.lower().strip() for loc in candidate_locations]
-
     # Check exact city match
-    for cloc in candidate_locs:
+    for cloc, _ in candidates:
         if cloc in job_loc or job_loc in cloc:
             return 20, f"Location: Exact match — {job_location}"
 
     # Check same state/region
     job_state = _get_state(job_loc)
-    for cloc in candidate_locs:
-        candidate_state = _get_state(cloc)
-        if candidate_state and job_state and candidate_state == job_state:
-            return 15, f"Location: Same region — {job_location}"
+    if job_state:
+        for _, candidate_state in candidates:
+            if candidate_state == job_state:
+                return 15, f"Location: Same region — {job_location}"
 
     # Check if candidate wants remote
-    if "remote" in candidate_locs:
+    if any(cloc == "remote" for cloc, _ in candidates):
         if job_location_type and job_location_type.lower() == "hybrid":
             return 12, f"Location: Hybrid role in {job_location}"
 
     return 5, f"Location: Different — {job_location}"
 
 
-def _score_salary(candidate_min: Optional[int], job_min: Optional[int], job_max: Optional[int]) -> tuple:
-    """Score salary match (0-15 points). Returns (score, reason)."""
-    if candidate_min is None or (job_min is None and job_max is None):
-        return 8, "Salary: Not enough data to compare"
-
-    job_top = job_max or job_min or 0
-
+def _score_salary(candidate_min: Optional[int], known: bool, job_top: int) -> int:
+    """Score salary match (0-15 points)."""
+    if candidate_min is None or not known:
+        return 8
     if job_top >= candidate_min:
-        return 15, f"Salary: Meets minimum requirement (₹{job_top:,}/mo ≥ ₹{candidate_min:,}/mo)"
-
+        return 15
     if job_top >= candidate_min * 0.8:
-        return 10, f"Salary: Close to minimum (₹{job_top:,}/mo vs ₹{candidate_min:,}/mo desired)"
-
-    return 3, f"Salary: Below minimum (₹{job_top:,}/mo vs ₹{candidate_min:,}/mo desired)"
+        return 10
+    return 3
 
 
-def _score_experience(candidate_years: Optional[int], job_min: Optional[int], job_max: Optional[int]) -> tuple:
-    """Score experience match (0-15 points). Returns (score, reason)."""
-    if candidate_years is None or (job_min is None and job_max is None):
-        return 8, "Experience: Not enough data to compare"
-
-    jmin = job_min or 0
-    jmax = job_max or 99
-
+def _score_experience(candidate_years: Optional[int], known: bool, jmin: int, jmax: int) -> int:
+    """Score experience match (0-15 points)."""
+    if candidate_years is None or not known:
+        return 8
     if jmin <= candidate_years <= jmax:
-        return 15, f"Experience: {candidate_years} years matches {jmin}-{jmax} year requirement"
-
+        return 15
     # Close match (within 1 year)
-    if candidate_years >= jmin - 1 and candidate_years <= jmax + 1:
-        return 10, f"Experience: Close match — {candidate_years} years vs {jmin}-{jmax} required"
-
+    if jmin - 1 <= candidate_years <= jmax + 1:
+        return 10
     if candidate_years > jmax:
-        return 7, f"Experience: Overqualified — {candidate_years} years vs {jmin}-{jmax} required"
-
-    return 3, f"Experience: Underqualified — {candidate_years} years vs {jmin}-{jmax} required"
-
+        return 7
+    return 3
 
-def _score_recency(posted_at: Optional[str]) -> tuple:
-    """Score job recency (0-10 points). Returns (score, reason)."""
-    if not posted_at:
-        return 5, "Recency: Unknown posting date"
-
-    try:
-        posted = datetime.fromisoformat(posted_at.replace("Z", "+00:00")) if isinstance(posted_at, str) else posted_at
-        now = datetime.now(posted.tzinfo) if posted.tzinfo else datetime.now()
-        days_ago = (now - posted).days
-    except Exception:
-        return 5, "Recency: Unknown posting date"
 
+def _score_recency(days_ago: Optional[int]) -> int:
+    """Score job recency (0-10 points)."""
+    if days_ago is None:
+        return 5
+    if days_ago <= 1:
+        return 10
+    if days_ago <= 7:
+        return 8
+    if days_ago <= 30:
+        return 5
+    return 2
+
+
+def _salary_reason(score: int, job_top: int, candidate_min: Optional[int]) -> str:
+    """Explain a salary score."""
+    if score == 15:
+        return f"Salary: Meets minimum requirement (₹{job_top:,}/mo ≥ ₹{candidate_min:,}/mo)"
+    if score == 10:
+        return f"Salary: Close to minimum (₹{job_top:,}/mo vs ₹{candidate_min:,}/mo desired)"
+    if score == 3:
+        return f"Salary: Below minimum (₹{job_top:,}/mo vs ₹{candidate_min:,}/mo desired)"
+    return "Salary: Not enough data to compare"
+
+
+def _experience_reason(score: int, candidate_years: Optional[int], jmin: int, jmax: int) -> str:
+    """Explain an experience score."""
+    if score == 15:
+        return f"Experience: {candidate_years} years matches {jmin}-{jmax} year requirement"
+    if score == 10:
+        return f"Experience: Close match — {candidate_years} years vs {jmin}-{jmax} required"
+    if score == 7:
+        return f"Experience: Overqualified — {candidate_years} years vs {jmin}-{jmax} required"
+    if score == 3:
+        return f"Experience: Underqualified — {candidate_years} years vs {jmin}-{jmax} required"
+    return "Experience: Not enough data to compare"
+
+
+def _recency_reason(days_ago: Optional[int]) -> str:
+    """Explain a recency score."""
+    if days_ago is None:
+        return "Recency: Unknown posting date"
     if days_ago <= 1:
-        return 10, "Recency: Posted today"
-    elif days_ago <= 7:
-        return 8, f"Recency: Posted {days_ago} days ago"
-    elif days_ago <= 30:
-        return 5, f"Recency: Posted {days_ago} days ago"
-    else:
-        return 2, f"Recency: Posted {days_ago} days ago"
+        return "Recency: Posted today"
+    return f"Recency: Posted {days_ago} days ago"
+
+
+# ── Active-job snapshot ──────────────────────────────────
+
+# Candidate-independent columns for every active job; posted_epoch is NULL when
+# posted_at is missing or not a parseable date.
+# Column order is relied on by _snapshot_job and _format_match: display
+# fields first, then the fields only the scoring pass reads.
+SNAPSHOT_SQL = """
+    SELECT j.id, j.title, c.name, j.location, j.description_short, j.apply_url,
+           j.source, j.salary_min, j.salary_max, j.skills,
+           j.location_type, j.experience_min, j.experience_max,
+           COALESCE(NULLIF(j.salary_max, 0), NULLIF(j.salary_min, 0), 0) AS sal_top,
+           COALESCE(j.experience_min, 0) AS exp_lo,
+           COALESCE(NULLIF(j.experience_max, 0), 99) AS exp_hi,
+           CAST(strftime('%s', j.posted_at) AS INTEGER) AS posted_epoch
+    FROM jobs j
+    LEFT JOIN companies c ON j.company_id = c.id
+    WHERE j.is_active = 1
+"""
+
+# Rebuilt only when the newest scraped_at or the active job count changes.
+_SNAPSHOT = {"stamp": None, "rows": [], "jobs": []}
+_SNAPSHOT_LOCK = asyncio.Lock()
+
+
+def _snapshot_job(row) -> tuple:
+    """Precompute the fields the scoring loop reads for one job."""
+    (_, _, _, location, _, _, _, salary_min, salary_max, skills,
+     location_type, experience_min, experience_max, sal_top, exp_lo, exp_hi, posted_epoch) = row
+    j_set, j_mask, _ = _parse_job_skills(skills or "[]")
+    return (
+        j_mask,
+        len(j_set),
+        (location, location_type),
+        salary_min is not None or salary_max is not None,
+        sal_top,
+        experience_min is not None or experience_max is not None,
+        exp_lo,
+        exp_hi,
+        posted_epoch,
+    )
+
+
+async def _get_snapshot(db) -> tuple:
+    """Return (rows, jobs) for all active jobs, reloading them if the table changed."""
+    cursor = await db.execute("SELECT MAX(scraped_at), COUNT(*) FROM jobs WHERE is_active = 1")
+    stamp = tuple(await cursor.fetchone())
+    if _SNAPSHOT["stamp"] != stamp:
+        async with _SNAPSHOT_LOCK:
+            if _SNAPSHOT["stamp"] != stamp:
+                cursor = await db.execute(SNAPSHOT_SQL)
+                rows = await cursor.fetchall()
+                jobs = [_snapshot_job(row) for row in rows]
+                _SNAPSHOT.update(stamp=stamp, rows=rows, jobs=jobs)
+    return _SNAPSHOT["rows"], _SNAPSHOT["jobs"]
+
+
+def _format_match(
+    row,
+    job: tuple,
+    total_score: int,
+    c_set: frozenset,
+    locations: tuple,
+    salary_min: Optional[int],
+    experience_years: Optional[int],
+    now: int,
+) -> dict:
+    """Build the response entry, with match reasons, for one scored job."""
+    (job_id, title, company_name, location, description_short, apply_url,
+     source, job_salary_min, job_salary_max, skills, *_) = row
+    _, _, loc_key, sal_known, sal_top, exp_known, exp_lo, exp_hi, posted_epoch = job
+    j_set, _, job_skill_count = _parse_job_skills(skills or "[]")
+    matched_skills = sorted(c_set & j_set)
+    missing_skills = sorted(j_set - c_set)
+    days_ago = None if posted_epoch is None else (now - posted_epoch) // 86400
+
+    reasons = []
+    if c_set and job_skill_count:
+        reasons.append(f"Skills match: {', '.join(matched_skills[:5])} ({len(matched_skills)}/{job_skill_count} required skills)")
+    reasons.append(_score_location(locations, *loc_key)[1])
+    reasons.append(_experience_reason(
+        _score_experience(experience_years, exp_known, exp_lo, exp_hi), experience_years, exp_lo, exp_hi))
+    reasons.append(_salary_reason(_score_salary(salary_min, sal_known, sal_top), sal_top, salary_min))
+    reasons.append(_recency_reason(days_ago))
+
+    # Build salary range string
+    salary_range = None
+    if job_salary_min and job_salary_max:
+        salary_range = f"₹{job_salary_min//1000}K-{job_salary_max//1000}K/mo"
+    elif job_salary_min:
+        salary_range = f"₹{job_salary_min//1000}K+/mo"
+
+    return {
+        "id": job_id,
+        "title": title,
+        "company": company_name or "Unknown",
+        "location": location,
+        "salary_range": salary_range,
+        "match_score": total_score,
+        "match_reasons": reasons,
+        "description_short": description_short,
+        "apply_url": apply_url,
+        "source": source,
+        "skills_match": matched_skills,
+        "skills_missing": missing_skills[:5],
+    }
 
 
 async def match_jobs(
@@ -173,81 +305,48 @@ async def match_jobs(
     """Match candidate profile against all active jobs. Returns session data."""
     start = time.time()
 
-    # Extract skills from resume if provided
-    candidate_skills = list(skills or [])
-    if resume_text:
-        extracted = extract_skills_from_text(resume_text)
-        candidate_skills = list(set(normalize_skills(candidate_skills + extracted)))
-    else:
-        candidate_skills = normalize_skills(candidate_skills)
+    # Merge given skills with any extracted from the resume, normalized and deduped in one pass
+    extracted = extract_skills_from_text(resume_text) if resume_text else []
+    candidate_skills = sorted(
+        {normalize_skill(s) for s in chain(skills or [], extracted)} - {""}
+    )
 
     db = await get_db()
-
-    # Fetch all active jobs (for matching we need them all)
-    cursor = await db.execute("""
-        SELECT j.*, c.name as company_name, c.industry as company_industry,
-               c.size as company_size
-        FROM jobs j
-        LEFT JOIN companies c ON j.company_id = c.id
-        WHERE j.is_active = 1
-    """)
-    rows = await cursor.fetchall()
-
-    scored_jobs = []
-    for row in rows:
-        job_skills_raw = row["skills"] if row["skills"] else "[]"
-        try:
-            job_skills = json.loads(job_skills_raw)
-        except (json.JSONDecodeError, TypeError):
-            job_skills = []
-
-        # Score components
-        skill_score, matched_skills, missing_skills = _score_skills(candidate_skills, job_skills)
-        loc_score, loc_reason = _score_location(preferred_locations or [], row["location"], row["location_type"])
-        sal_score, sal_reason = _score_salary(salary_min, row["salary_min"], row["salary_max"])
-        exp_score, exp_reason = _score_experience(experience_years, row["experience_min"], row["experience_max"])
-        rec_score, rec_reason = _score_recency(row["posted_at"])
-
-        total_score = skill_score + loc_score + sal_score + exp_score + rec_score
-
-        reasons = []
-        if candidate_skills and job_skills:
-            reasons.append(f"Skills match: {', '.join(matched_skills[:5])} ({len(matched_skills)}/{len(job_skills)} required skills)")
-        reasons.append(loc_reason)
-        reasons.append(exp_reason)
-        reasons.append(sal_reason)
-        reasons.append(rec_reason)
-
-        # Build salary range string
-        salary_range = None
-        if row["salary_min"] and row["salary_max"]:
-            salary_range = f"₹{row['salary_min']//1000}K-{row['salary_max']//1000}K/mo"
-        elif row["salary_min"]:
-            salary_range = f"₹{row['salary_min']//1000}K+/mo"
-
-        scored_jobs.append({
-            "id": row["id"],
-            "title": row["title"],
-            "company": row["company_name"] or "Unknown",
-            "location": row["location"],
-            "salary_range": salary_range,
-            "match_score": total_score,
-            "match_reasons": reasons,
-            "description_short": row["description_short"],
-            "apply_url": row["apply_url"],
-            "source": row["source"],
-            "skills_match": matched_skills,
-            "skills_missing": missing_skills[:5],
-        })
-
-    # Sort by score descending
-    scored_jobs.sort(key=lambda x: x["match_score"], reverse=True)
-    top_jobs = scored_jobs[:limit]
+    rows, jobs = await _get_snapshot(db)
+
+    c_set = frozenset(candidate_skills)  # already normalized above
+    c_has_skills = bool(c_set)
+    c_mask = skills_to_mask(c_set)  # after the snapshot, so job skills have bits
+    locations = _candidate_locations(preferred_locations or [])
+    now = int(time.time())
+
+    # Integer-only pass over every job; location strings repeat heavily, so
+    # their scores are memoized for the duration of the request.
+    loc_scores = {}
+    scores = []
+    for j_mask, j_size, loc_key, sal_known, sal_top, exp_known, exp_lo, exp_hi, posted_epoch in jobs:
+        loc_score = loc_scores.get(loc_key)
+        if loc_score is None:
+            loc_score = loc_scores[loc_key] = _score_location(locations, *loc_key)[0]
+        days_ago = None if posted_epoch is None else (now - posted_epoch) // 86400
+        scores.append(
+            _score_skills(c_has_skills, c_mask, j_mask, j_size) + loc_score
+            + _score_salary(salary_min, sal_known, sal_top)
+            + _score_experience(experience_years, exp_known, exp_lo, exp_hi)
+            + _score_recency(days_ago)
+        )
+
+    # Top-K by score (ties keep table order); reasons are only formatted for returned jobs
+    ranked = heapq.nlargest(limit, range(len(jobs)), key=scores.__getitem__)
+    top_jobs = [
+        _format_match(rows[i], jobs[i], scores[i], c_set, locations, salary_min, experience_years, now)
+        for i in ranked
+    ]
     elapsed = (time.time() - start) * 1000
 
     return {
         "query_time_ms": round(elapsed, 2),
-        "match_count": len([j for j in scored_jobs if j["match_score"] >= 30]),
+        "match_count": sum(1 for score in scores if score >= 30),
         "jobs": top_jobs,
         "extracted_skills": candidate_skills,
     }
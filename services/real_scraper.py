@@ -1,8 +1,11 @@
 """Real job scraper - LinkedIn public pages. No login needed."""
-import aiohttp, asyncio, json, re, hashlib, sqlite3, logging
+import aiohttp, asyncio, json, os, random, re, hashlib, sqlite3, sys, logging
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.skills import KeywordScan, normalize_skills
 logger = logging.getLogger(__name__)
+SCRAPE_CONCURRENCY = 3  # LinkedIn requests in flight at once
 
 SEARCH_QUERIES = [
     ("ML data associate", "India"), ("data annotation AI", "India"),
@@ -35,49 +38,48 @@ def gen_jid(src, sid):
 def gen_cid(name):
     return f"c_{hashlib.md5(re.sub(r'[^a-z0-9]','',name.lower()).encode()).hexdigest()[:10]}"
 
+LOC_RE = re.compile(r'Hyderabad|Bangalore|Bengaluru|Mumbai|Pune|Chennai|Delhi|Kolkata|India|Remote|Noida|Gurugram|Karnataka|Telangana|Maharashtra')
+_TIME_RE = re.compile(r'(\d+)\s*(second|minute|hour|day|week|month)')
+_UNIT = {"second":1,"minute":60,"hour":3600,"day":86400,"week":604800,"month":2592000}  # seconds; month = 30 days
+
 def parse_time(text):
     text = text.strip().lower()
     now = datetime.utcnow()
     if "just now" in text: return now.isoformat()+"Z"
-    m = re.search(r'(\d+)\s*(second|minute|hour|day|week|month)', text)
-    if m:
-        n, u = int(m.group(1)), m.group(2)
-        d = {"second":timedelta(seconds=n),"minute":timedelta(minutes=n),"hour":timedelta(hours=n),
-             "day":timedelta(days=n),"week":timedelta(weeks=n),"month":timedelta(days=n*30)}
-        for k,v in d.items():
-            if u.startswith(k): return (now-v).isoformat()+"Z"
+    m = _TIME_RE.search(text)
+    if m: return (now-timedelta(seconds=int(m[1])*_UNIT[m[2]])).isoformat()+"Z"
     return None
 
+SKILL_KEYWORDS = {"python":["python"],"java ":["java"],"react":["react","javascript"],"node":["nodejs"],
+    "golang":["golang"],"go ":["golang"],"docker":["docker"],"kubernetes":["kubernetes"],
+    "aws":["aws","cloud"],"azure":["azure","cloud"],"gcp":["gcp","cloud"],
+    "devops":["devops","ci-cd"],"machine learning":["machine-learning","python"],
+    "ml ":["machine-learning","python"],"deep learning":["deep-learning","python"],
+    "nlp":["nlp","python"],"computer vision":["computer-vision","python"],
+    "data scien":["python","sql","machine-learning"],"data analy":["python","sql","excel"],
+    "data engineer":["python","sql","spark"],"data annot":["data-annotation"],
+    "frontend":["html","css","javascript"],"backend":["api","databases"],
+    "full stack":["javascript","api"],"android":["kotlin","android"],
+    "ios":["swift","ios"],"flutter":["flutter","dart"],"security":["cybersecurity"],
+    "qa":["testing"],"sdet":["testing","automation"],"product manager":["product-management"],
+    "ux":["ux-design","figma"],"ui":["ui-design","figma"],"terraform":["terraform"],
+    "rust":["rust"],"c++":["c++"],".net":[".net","c#"]}
+CAT_KEYWORDS = {"data-science":["data scien","machine learning","ml ","deep learning","nlp","computer vision","ai ","data annot"],
+    "engineering":["software","developer","engineer","backend","frontend","full stack","devops","sre","cloud","golang","flutter","react native","embedded"],
+    "design":["designer","ux","ui ","product design"],"product":["product manager","product owner"],
+    "qa":["qa ","quality","sdet","test"],"security":["security","cyber","penetration"],
+    "operations":["project manager","scrum","delivery"],"content":["writer","content","documentation"]}
+
+_SKILL_SCAN = KeywordScan(SKILL_KEYWORDS)
+_CAT_SCAN = KeywordScan(kw for kws in CAT_KEYWORDS.values() for kw in kws)
+
 def guess_skills(title):
-    t = title.lower(); skills = []
-    mp = {"python":["python"],"java ":["java"],"react":["react","javascript"],"node":["nodejs"],
-          "golang":["golang"],"go ":["golang"],"docker":["docker"],"kubernetes":["kubernetes"],
-          "aws":["aws","cloud"],"azure":["azure","cloud"],"gcp":["gcp","cloud"],
-          "devops":["devops","ci-cd"],"machine learning":["machine-learning","python"],
-          "ml ":["machine-learning","python"],"deep learning":["deep-learning","python"],
-          "nlp":["nlp","python"],"computer vision":["computer-vision","python"],
-          "data scien":["python","sql","machine-learning"],"data analy":["python","sql","excel"],
-          "data engineer":["python","sql","spark"],"data annot":["data-annotation"],
-          "frontend":["html","css","javascript"],"backend":["api","databases"],
-          "full stack":["javascript","api"],"android":["kotlin","android"],
-          "ios":["swift","ios"],"flutter":["flutter","dart"],"security":["cybersecurity"],
-          "qa":["testing"],"sdet":["testing","automation"],"product manager":["product-management"],
-          "ux":["ux-design","figma"],"ui":["ui-design","figma"],"terraform":["terraform"],
-          "rust":["rust"],"c++":["c++"],".net":[".net","c#"]}
-    for kw,sk in mp.items():
-        if kw in t: skills.extend(sk)
-    return list(set(skills))
+    return list({sk for kw in _SKILL_SCAN.hits(title.lower()) for sk in SKILL_KEYWORDS[kw]})
 
 def guess_cat(title):
-    t = title.lower()
-    cats = {"data-science":["data scien","machine learning","ml ","deep learning","nlp","computer vision","ai ","data annot"],
-            "engineering":["software","developer","engineer","backend","frontend","full stack","devops","sre","cloud","golang","flutter","react native","embedded"],
-            "design":["designer","ux","ui ","product design"],"product":["product manager","product owner"],
-            "qa":["qa ","quality","sdet","test"],"security":["security","cyber","penetration"],
-            "operations":["project manager","scrum","delivery"],"content":["writer","content","documentation"]}
-    for cat,kws in cats.items():
-        for kw in kws:
-            if kw in t: return cat
+    hits = _CAT_SCAN.hits(title.lower())
+    for cat,kws in CAT_KEYWORDS.items():
+        if any(kw in hits for kw in kws): return cat
     return "engineering"
 
 async def scrape_linkedin(query, location, session):
@@ -89,43 +91,41 @@ async def scrape_linkedin(query, location, session):
         async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
             if resp.status != 200: return []
             html = await resp.text()
-            soup = BeautifulSoup(html, "html.parser")
-            for card in soup.find_all("li"):
+            tree = LexborHTMLParser(html)
+            for card in tree.css("li"):
                 try:
-                    link = card.find("a", href=re.compile(r"/jobs/view/"))
+                    link = card.css_first("a[href*='/jobs/view/']")
                     if not link: continue
-                    href = link.get("href","")
-                    if "/jobs/view/" not in href: continue
+                    href = link.attributes.get("href") or ""
                     jid_m = re.search(r'(\d{8,})', href)
                     if not jid_m: continue
                     ljid = jid_m.group(1)
                     clean_url = re.sub(r'\?.*$','',href)
                     if not clean_url.startswith("http"): clean_url = "https://www.linkedin.com" + clean_url
                     
-                    title_el = card.find("h3") or card.find("span", class_=re.compile(r"title"))
-                    title = title_el.get_text(strip=True) if title_el else link.get_text(strip=True)
+                    title_el = card.css_first("h3") or card.css_first("span[class*='title']")
+                    title = title_el.text(strip=True) if title_el else link.text(strip=True)
                     title = re.sub(r'\s+',' ',title).strip()
                     if not title or len(title)<3 or len(title)>200: continue
                     
-                    comp_el = card.find("h4") or card.find("a", class_=re.compile(r"company|subtitle"))
-                    if not comp_el: comp_el = card.find("span", class_=re.compile(r"subtitle|company"))
-                    company = comp_el.get_text(strip=True) if comp_el else None
+                    comp_el = card.css_first("h4") or card.css_first("a[class*='company'], a[class*='subtitle']")
+                    if not comp_el: comp_el = card.css_first("span[class*='subtitle'], span[class*='company']")
+                    company = comp_el.text(strip=True) if comp_el else None
                     if not company or len(company)<2: continue
                     
                     loc_el = None
-                    for s in card.find_all("span"):
-                        txt = s.get_text(strip=True)
-                        if any(c in txt for c in ["Hyderabad","Bangalore","Bengaluru","Mumbai","Pune","Chennai","Delhi","Kolkata","India","Remote","Noida","Gurugram","Karnataka","Telangana","Maharashtra"]):
+                    for s in card.css("span"):
+                        if LOC_RE.search(s.text(strip=True)):
                             loc_el = s; break
-                    job_loc = loc_el.get_text(strip=True) if loc_el else location
+                    job_loc = loc_el.text(strip=True) if loc_el else location
                     
-                    time_el = card.find("time")
-                    posted = parse_time(time_el.get_text(strip=True)) if time_el else datetime.utcnow().isoformat()+"Z"
+                    time_el = card.css_first("time")
+                    posted = parse_time(time_el.text(strip=True)) if time_el else datetime.utcnow().isoformat()+"Z"
                     
                     jobs.append({"id":gen_jid("linkedin",ljid),"title":title,"company_name":company,
                         "company_id":gen_cid(company),"location":job_loc,
                         "location_type":"remote" if "remote" in (title+job_loc).lower() else "onsite",
-                        "skills":json.dumps(guess_skills(title)),"category":guess_cat(title),
+                        "skills":json.dumps(sorted(normalize_skills(guess_skills(title)))),"category":guess_cat(title),
                         "employment_type":"full-time","apply_url":clean_url,
                         "source":"linkedin","source_id":ljid,"posted_at":posted,
                         "description_short":f"Join {company} as a {title}. Location: {job_loc}."})
@@ -134,42 +134,57 @@ async def scrape_linkedin(query, location, session):
     except Exception as e: logger.error(f"Error: {e}")
     return jobs
 
+FTS_INSERT_SQL = """INSERT INTO jobs_fts(job_id,title,description,skills,location,company_name)
+    SELECT j.id,j.title,COALESCE(j.description,''),COALESCE(j.skills,''),
+    COALESCE(j.location,''),COALESCE(co.name,'') FROM jobs j LEFT JOIN companies co ON j.company_id=co.id"""
+
 async def run_full_scrape(db_path="agentjobs.db"):
     all_jobs, all_companies, seen = [], {}, set()
-    connector = aiohttp.TCPConnector(limit=3)
+    connector = aiohttp.TCPConnector(limit=SCRAPE_CONCURRENCY)
+    sem = asyncio.Semaphore(SCRAPE_CONCURRENCY)
     async with aiohttp.ClientSession(connector=connector) as session:
-        for i,(q,loc) in enumerate(SEARCH_QUERIES):
-            logger.info(f"[{i+1}/{len(SEARCH_QUERIES)}] Scraping: '{q}' in {loc}")
-            jobs = await scrape_linkedin(q, loc, session)
-            for j in jobs:
-                if j["id"] not in seen:
-                    seen.add(j["id"]); all_jobs.append(j)
-                    cid = j["company_id"]
-                    if cid not in all_companies:
-                        all_companies[cid] = {"id":cid,"name":j["company_name"]}
-            logger.info(f"  Found {len(jobs)}, total unique: {len(all_jobs)}")
-            await asyncio.sleep(1.5)
+        async def _one(i, q, loc):
+            async with sem:  # a slot is held through the jittered pause to stay polite
+                logger.info(f"[{i+1}/{len(SEARCH_QUERIES)}] Scraping: '{q}' in {loc}")
+                jobs = await scrape_linkedin(q, loc, session)
+                logger.info(f"  Found {len(jobs)} for '{q}' in {loc}")
+                await asyncio.sleep(random.uniform(0.5, 1.5))
+            return jobs
+        results = await asyncio.gather(*(_one(i,q,loc) for i,(q,loc) in enumerate(SEARCH_QUERIES)))
+    for jobs in results:  # query order, so dedup keeps the same first occurrence as a serial run
+        for j in jobs:
+            if j["id"] not in seen:
+                seen.add(j["id"]); all_jobs.append(j)
+                cid = j["company_id"]
+                if cid not in all_companies:
+                    all_companies[cid] = {"id":cid,"name":j["company_name"]}
+    logger.info(f"Total unique: {len(all_jobs)}")
     
     conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
     c = conn.cursor()
     now = datetime.utcnow().isoformat()
-    for comp in all_companies.values():
-        c.execute("INSERT OR IGNORE INTO companies (id, name, created_at, updated_at) VALUES (?,?,?,?)",
-                  (comp["id"], comp["name"], now, now))
-    for j in all_jobs:
-        c.execute("""INSERT OR REPLACE INTO jobs (id,company_id,title,description_short,location,location_type,
+    company_rows = [(comp["id"], comp["name"], now, now) for comp in all_companies.values()]
+    job_rows = [(j["id"],j["company_id"],j["title"],j["description_short"],j["location"],j["location_type"],
+                 j["skills"],j["category"],j["employment_type"],j["apply_url"],j["source"],j["source_id"],
+                 j["posted_at"],now,True) for j in all_jobs]
+    with conn:  # one transaction for both tables
+        c.executemany("INSERT OR IGNORE INTO companies (id, name, created_at, updated_at) VALUES (?,?,?,?)", company_rows)
+        c.executemany("""INSERT OR REPLACE INTO jobs (id,company_id,title,description_short,location,location_type,
                      skills,category,employment_type,apply_url,source,source_id,posted_at,scraped_at,is_active)
-                     VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                  (j["id"],j["company_id"],j["title"],j["description_short"],j["location"],j["location_type"],
-                   j["skills"],j["category"],j["employment_type"],j["apply_url"],j["source"],j["source_id"],
-                   j["posted_at"],now,True))
-    conn.commit()
+                     VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""", job_rows)
     try:
-        c.execute("DELETE FROM jobs_fts")
-        c.execute("""INSERT INTO jobs_fts(job_id,title,description,skills,location,company_name)
-                     SELECT j.id,j.title,COALESCE(j.description,''),COALESCE(j.skills,''),
-                     COALESCE(j.location,''),COALESCE(co.name,'') FROM jobs j LEFT JOIN companies co ON j.company_id=co.id""")
-        conn.commit()
+        c.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        stamp = c.execute("SELECT value FROM meta WHERE key='last_fts_stamp'").fetchone()
+        with conn:
+            if stamp:  # only reindex rows scraped since the last refresh
+                c.execute("DELETE FROM jobs_fts WHERE job_id IN (SELECT id FROM jobs WHERE scraped_at > ?)", stamp)
+                c.execute(FTS_INSERT_SQL + " WHERE j.scraped_at > ?", stamp)
+            else:
+                c.execute("DELETE FROM jobs_fts")
+                c.execute(FTS_INSERT_SQL)
+            c.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_fts_stamp', ?)", (now,))
     except Exception as e: logger.warning(f"FTS: {e}")
     conn.close()
     return {"total_jobs":len(all_jobs),"total_companies":len(all_companies),"queries_run":len(SEARCH_QUERIES)}
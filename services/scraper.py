@@ -1,7 +1,7 @@
 """Job scraping engine for AgentJobs (placeholder for real scraping)."""
 
 import aiohttp
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from typing import List, Optional, Dict
 import json
 import asyncio
@@ -50,6 +50,14 @@ COMPANY_CAREER_URLS = {
 }
 
 
+# Listing containers: a/div/li elements whose class mentions a job-ish keyword
+LISTING_SELECTOR = ", ".join(
+    f'{tag}[class*="{kw}" i]'
+    for tag in ("a", "div", "li")
+    for kw in ("job", "position", "opening", "career", "listing")
+)
+
+
 class JobScraper:
     """Async job scraper engine."""
 
@@ -57,40 +65,50 @@ class JobScraper:
         self.max_concurrent = max_concurrent
         self.semaphore = asyncio.Semaphore(max_concurrent)
 
+    def _session(self) -> aiohttp.ClientSession:
+        """Create a client session with a cached-DNS, per-host-limited connector."""
+        connector = aiohttp.TCPConnector(ttl_dns_cache=300, limit_per_host=2)
+        return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30))
+
     async def scrape_url(self, url: str, company_name: str) -> List[Dict]:
-        """Scrape jobs from a career page URL."""
+        """Scrape jobs from a single career page URL."""
+        async with self._session() as session:
+            return await self._scrape_url(session, url, company_name)
+
+    async def _scrape_url(self, session: aiohttp.ClientSession, url: str, company_name: str) -> List[Dict]:
+        """Scrape jobs from a career page URL using a shared session."""
         async with self.semaphore:
             try:
-                timeout = aiohttp.ClientTimeout(total=30)
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(url, headers={
-                        "User-Agent": "Mozilla/5.0 (compatible; AgentJobs/1.0)"
-                    }) as response:
-                        if response.status != 200:
-                            return []
-                        html = await response.text()
-                        return self._parse_career_page(html, company_name, url)
+                async with session.get(url, headers={
+                    "User-Agent": "Mozilla/5.0 (compatible; AgentJobs/1.0)"
+                }) as response:
+                    if response.status != 200:
+                        return []
+                    html = await response.text()
+                    return self._parse_career_page(html, company_name, url)
             except Exception as e:
                 print(f"Error scraping {url}: {e}")
                 return []
 
     def _parse_career_page(self, html: str, company_name: str, url: str) -> List[Dict]:
         """Parse a career page HTML to extract job listings."""
-        soup = BeautifulSoup(html, "html.parser")
+        tree = LexborHTMLParser(html)
         jobs = []
 
         # Generic parsing — look for common patterns
         # This is a basic scraper; real production would need per-site parsers
-        job_elements = soup.find_all(["a", "div", "li"], class_=lambda c: c and any(
-            kw in str(c).lower() for kw in ["job", "position", "opening", "career", "listing"]
-        ))
+        job_elements = tree.css(LISTING_SELECTOR)
 
         for elem in job_elements[:20]:
-            title_elem = elem.find(["h2", "h3", "h4", "a", "span"])
+            # css() can match elem itself; only its descendants may carry the title
+            title_elem = next(
+                (node for node in elem.css("h2, h3, h4, a, span") if node.mem_id != elem.mem_id),
+                None,
+            )
             if title_elem:
-                title = title_elem.get_text(strip=True)
+                title = title_elem.text(strip=True)
                 if len(title) > 5 and len(title) < 200:
-                    link = elem.get("href") or (title_elem.get("href") if title_elem.name == "a" else None)
+                    link = elem.attributes.get("href") or (title_elem.attributes.get("href") if title_elem.tag == "a" else None)
                     jobs.append({
                         "title": title,
                         "company": company_name,
@@ -101,12 +119,13 @@ class JobScraper:
         return jobs
 
     async def scrape_all(self) -> List[Dict]:
-        """Scrape all company career pages."""
-        tasks = [
-            self.scrape_url(url, company)
-            for company, url in COMPANY_CAREER_URLS.items()
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        """Scrape all company career pages over one shared session."""
+        async with self._session() as session:
+            tasks = [
+                self._scrape_url(session, url, company)
+                for company, url in COMPANY_CAREER_URLS.items()
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
         all_jobs = []
         for result in results:
             if isinstance(result, list):
@@ -1,10 +1,19 @@
 """Search engine logic for AgentJobs."""
 
+import base64
 import json
 import re
 import time
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional, List, Tuple
-from database import get_db
+from config import settings
+from database import read_db
+from services.skills import normalize_skill
+
+
+class SearchParamError(ValueError):
+    """Rejected cursor, offset or sort parameters (safe to report to the client)."""
 
 
 async def search_jobs(
@@ -24,54 +33,111 @@ async def search_jobs(
     sort: str = "relevance",
     limit: int = 20,
     offset: int = 0,
-) -> Tuple[List[dict], int, float]:
+    after_cursor: Optional[str] = None,
+    include_description: bool = False,
+) -> Tuple[List[dict], int, float, Optional[str]]:
     """
-    Search jobs with filters. Returns (jobs, total_count, query_time_ms).
+    Search jobs with filters. Returns (jobs, total_count, query_time_ms, next_cursor).
+
+    Passing the previous page's next_cursor as after_cursor pages by keyset
+    instead of OFFSET. Raises SearchParamError for a malformed cursor, a sort
+    that cannot be paged by cursor, or an offset beyond
+    settings.max_search_offset.
+    The full description is only loaded when include_description is set.
     """
     start = time.time()
-    db = await get_db()
-
-    # If text search query, use FTS
-    if q:
-        return await _fts_search(
-            db, q, title, location, location_type, company, skills,
-            salary_min, salary_max, experience_min, experience_max,
-            category, employment_type, posted_after, sort, limit, offset, start
-        )
-
-    # Otherwise use regular SQL filters
-    return await _filter_search(
-        db, title, location, location_type, company, skills,
-        salary_min, salary_max, experience_min, experience_max,
-        category, employment_type, posted_after, sort, limit, offset, start
-    )
+    after = _decode_cursor(after_cursor) if after_cursor else None
+    # Guards and dispatch go by the sanitized query: one with nothing left to
+    # match (e.g. "!!!") runs as a plain filter search, pageable by cursor
+    fts_query = _sanitize_fts_query(q) if q else ""
+    if after is None and offset > settings.max_search_offset:
+        # Every skipped row is still read and discarded by SQLite. Only
+        # posted_at order hands out cursors, so point other sorts there.
+        if sort == "salary" or (fts_query and sort == "relevance"):
+            hint = f"results past it are not available for sort={sort}; use sort=posted_at to page further"
+        else:
+            hint = "page further with the cursor from next_cursor"
+        raise SearchParamError(f"Offset is limited to {settings.max_search_offset}; {hint}")
+    if after and fts_query and sort == "relevance":
+        raise SearchParamError("Cursor pagination is not supported for relevance-ranked search; use offset")
+    if after and sort == "salary":
+        raise SearchParamError("Cursor pagination is not supported for salary sort; use offset")
+    if limit <= 0:
+        return [], 0, round((time.time() - start) * 1000, 2), None
+
+    cache_key = (q, title, location, location_type, company, tuple(skills) if skills else None,
+                 salary_min, salary_max, experience_min, experience_max, category,
+                 employment_type, posted_after, sort, limit, offset, after, include_description)
+    cached = _cache_get(_result_cache, cache_key)
+    if cached is not None:
+        jobs, total, next_cursor = cached
+        return _copy_jobs(jobs), total, round((time.time() - start) * 1000, 2), next_cursor
+
+    async with read_db() as db:
+        # If text search query, use FTS
+        if fts_query:
+            result = await _fts_search(
+                db, fts_query, title, location, location_type, company, skills,
+                salary_min, salary_max, experience_min, experience_max,
+                category, employment_type, posted_after, sort, limit, offset, after,
+                include_description, start
+            )
+        else:
+            # Otherwise use regular SQL filters
+            result = await _filter_search(
+                db, title, location, location_type, company, skills,
+                salary_min, salary_max, experience_min, experience_max,
+                category, employment_type, posted_after, sort, limit, offset, after,
+                include_description, start
+            )
+
+    jobs, total, elapsed, next_cursor = result
+    _cache_put(_result_cache, cache_key, (_copy_jobs(jobs), total, next_cursor),
+               RESULT_CACHE_TTL, RESULT_CACHE_SIZE)
+    return result
+
+
+# FTS input cleanup: quotes dropped, anything but word characters, whitespace
+# and hyphens turned into a space. Latin-1 queries go through a fixed
+# str.translate table built here; anything beyond it takes the regex path, so
+# no per-query state is kept.
+_FTS_SANITIZE = str.maketrans({
+    c: None if c in "\"'" else " "
+    for c in map(chr, range(256)) if not re.match(r"[\w\s\-]", c)
+})
+_FTS_STRIP_RE = re.compile(r"[^\w\s\-]")
+
+
+def _sanitize_fts_query(q: str) -> str:
+    """Strip FTS5 special characters from a search query."""
+    if max(q) <= "\xff":
+        return q.translate(_FTS_SANITIZE).strip()
+    return _FTS_STRIP_RE.sub(" ", q.replace('"', "").replace("'", "")).strip()
 
 
 async def _fts_search(
-    db, q, title, location, location_type, company, skills,
+    db, fts_query, title, location, location_type, company, skills,
     salary_min, salary_max, experience_min, experience_max,
-    category, employment_type, posted_after, sort, limit, offset, start
+    category, employment_type, posted_after, sort, limit, offset, after,
+    include_description, start
 ):
-    """Full-text search using FTS5."""
+    """Full-text search using FTS5. fts_query is already sanitized."""
     params = []
     where_clauses = ["j.is_active = 1"]
 
-    # Clean FTS query — strip FTS5 special characters to prevent syntax errors
-    fts_query = q.replace('"', '').replace("'", "").strip()
-    fts_query = re.sub(r'[^\w\s\-]', ' ', fts_query).strip()
-    if not fts_query:
-        return await _filter_search(
-            db, title, location, location_type, company, skills,
-            salary_min, salary_max, experience_min, experience_max,
-            category, employment_type, posted_after, sort, limit, offset, start
-        )
-
     base_from = """
         FROM jobs j
         LEFT JOIN companies c ON j.company_id = c.id
         INNER JOIN jobs_fts fts ON fts.job_id = j.id
     """
 
+    # Required skills also ride along in the MATCH as skills-column phrases so
+    # FTS narrows the candidates; the job_skills filter added below keeps the
+    # match exact (a phrase like "ruby" would also hit "ruby-on-rails")
+    skill_phrases = _skill_phrases(skills)
+    if skill_phrases:
+        fts_query = f"({fts_query}) AND " + " AND ".join(skill_phrases)
+
     where_clauses.append("jobs_fts MATCH ?")
     params.append(fts_query)
 
@@ -82,39 +148,49 @@ async def _fts_search(
 
     where_sql = " AND ".join(where_clauses)
 
-    # Get total count
-    count_sql = f"SELECT COUNT(*) as cnt {base_from} WHERE {where_sql}"
-    cursor = await db.execute(count_sql, params)
-    row = await cursor.fetchone()
-    total = row[0] if row else 0
-
     # Sort
     order_by = _get_order_by(sort, has_fts=True)
 
     # Get results
-    select_sql = f"""
-        SELECT j.*, c.name as company_name, c.industry as company_industry,
-               c.size as company_size, fts.rank as fts_rank
-        {base_from}
-        WHERE {where_sql}
-        ORDER BY {order_by}
-        LIMIT ? OFFSET ?
-    """
-    params.extend([limit, offset])
-
-    cursor = await db.execute(select_sql, params)
-    rows = await cursor.fetchall()
+    # Ordering on fts.rank (BM25) needs no projected copy of it
+    columns = _job_columns(include_description)
+    rows, total = await _fetch_page(db, columns, base_from, where_sql, order_by,
+                                    params, limit, offset, after)
 
-    jobs = [_row_to_job(row) for row in rows]
+    jobs = _rows_to_jobs(rows)
+    next_cursor = _next_cursor(rows, limit, order_by)
     elapsed = (time.time() - start) * 1000
 
-    return jobs, total, round(elapsed, 2)
+    return jobs, total, round(elapsed, 2), next_cursor
+
+
+def _job_columns(include_description: bool) -> str:
+    """Select list for search pages: only what _job_dict reads, and the
+    (often large) description only on request."""
+    description = "j.description" if include_description else "NULL AS description"
+    return f"""j.id, j.title, j.location, j.location_type, j.salary_min, j.salary_max,
+               j.experience_min, j.experience_max, j.skills, j.category,
+               j.employment_type, {description}, j.description_short, j.posted_at,
+               j.apply_url, j.source, j.salary_text, j.source_id, j.scraped_at,
+               j.is_active, c.name as company_name, c.industry as company_industry,
+               c.size as company_size"""
+
+
+def _skill_phrases(skills: Optional[List[str]]) -> List[str]:
+    """FTS5 skills-column phrases for the skills that have a word character."""
+    phrases = []
+    for skill in skills or []:
+        canonical = normalize_skill(skill)
+        if re.search(r"\w", canonical):
+            phrases.append('skills : "' + canonical.replace('"', '""') + '"')
+    return phrases
 
 
 async def _filter_search(
     db, title, location, location_type, company, skills,
     salary_min, salary_max, experience_min, experience_max,
-    category, employment_type, posted_after, sort, limit, offset, start
+    category, employment_type, posted_after, sort, limit, offset, after,
+    include_description, start
 ):
     """Filter-based search without FTS."""
     params = []
@@ -131,57 +207,207 @@ async def _filter_search(
 
     where_sql = " AND ".join(where_clauses)
 
-    # Count
-    count_sql = f"SELECT COUNT(*) as cnt {base_from} WHERE {where_sql}"
-    cursor = await db.execute(count_sql, params)
-    row = await cursor.fetchone()
-    total = row[0] if row else 0
-
     order_by = _get_order_by(sort, has_fts=False)
 
+    columns = _job_columns(include_description)
+    rows, total = await _fetch_page(db, columns, base_from, where_sql, order_by,
+                                    params, limit, offset, after)
+
+    jobs = _rows_to_jobs(rows)
+    next_cursor = _next_cursor(rows, limit, order_by)
+    elapsed = (time.time() - start) * 1000
+
+    return jobs, total, round(elapsed, 2), next_cursor
+
+
+# ── Caches ──────────────────────────────────────────────────────
+
+# Totals change slowly, so keep them briefly per filter set (sort/limit/offset excluded)
+COUNT_CACHE_TTL = 30
+COUNT_CACHE_SIZE = 1024
+_count_cache: dict = {}
+
+# Whole pages for identical requests (first-page browsing, repeated agent queries)
+RESULT_CACHE_TTL = 30
+RESULT_CACHE_SIZE = 512
+_result_cache: dict = {}
+
+
+def _cache_get(cache: dict, key):
+    """Return a live cached value, or None."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    expires, value = entry
+    if expires < time.monotonic():
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def _cache_put(cache: dict, key, value, ttl: float, size: int):
+    """Store a value with a TTL, evicting the oldest entry when full."""
+    if key not in cache and len(cache) >= size:
+        cache.pop(next(iter(cache)))
+    cache[key] = (time.monotonic() + ttl, value)
+
+
+def _cached_count(key) -> Optional[int]:
+    """Return a live cached total for this filter set, if any."""
+    return _cache_get(_count_cache, key)
+
+
+def _store_count(key, total: int):
+    """Remember a total for this filter set."""
+    _cache_put(_count_cache, key, total, COUNT_CACHE_TTL, COUNT_CACHE_SIZE)
+
+
+def invalidate_search_cache():
+    """Drop cached pages and totals; call after writing jobs."""
+    _count_cache.clear()
+    _result_cache.clear()
+
+
+def _copy_jobs(jobs: List[dict]) -> List[dict]:
+    """Copy cached job dicts so callers can trim them without touching the cache."""
+    return [{**job, "company": dict(job["company"]), "skills": list(job["skills"])} for job in jobs]
+
+
+async def _fetch_page(db, columns, base_from, where_sql, order_by, params, limit, offset, after=None):
+    """Run a page query and return (rows, total), counting only on a cache miss."""
+    key = (base_from, where_sql, tuple(params))
+    total = _cached_count(key)
+
+    if after is not None:
+        # Keyset page: a window count would only see rows past the cursor, so
+        # count the whole filter set in an uncorrelated subquery instead
+        keyset_sql, keyset_params = _keyset_clause(after)
+        count_params = []
+        if total is None:
+            columns += f", (SELECT COUNT(*) {base_from} WHERE {where_sql}) AS total_count"
+            count_params = params
+        select_sql = f"""
+            SELECT {columns}
+            {base_from}
+            WHERE {where_sql} AND {keyset_sql}
+            ORDER BY {order_by}
+            LIMIT ?
+        """
+        cursor = await db.execute(select_sql, [*count_params, *params, *keyset_params, limit])
+        rows = await cursor.fetchall()
+        if total is None:
+            total = rows[0]["total_count"] if rows else await _count(db, base_from, where_sql, params)
+            _store_count(key, total)
+        return rows, total
+
+    if total is None:
+        columns += ", COUNT(*) OVER () AS total_count"
+
     select_sql = f"""
-        SELECT j.*, c.name as company_name, c.industry as company_industry,
-               c.size as company_size
+        SELECT {columns}
         {base_from}
         WHERE {where_sql}
         ORDER BY {order_by}
         LIMIT ? OFFSET ?
     """
-    params.extend([limit, offset])
-
-    cursor = await db.execute(select_sql, params)
+    cursor = await db.execute(select_sql, [*params, limit, offset])
     rows = await cursor.fetchall()
+    if rows and len(rows) < limit:
+        # A short, non-empty page is the last one, so the total is known
+        total = offset + len(rows)
+    elif total is not None:
+        return rows, total
+    elif rows:
+        total = rows[0]["total_count"]
+    elif offset == 0:
+        total = 0
+    else:
+        # Past the last page the window count has no row to ride on
+        total = await _count(db, base_from, where_sql, params)
 
-    jobs = [_row_to_job(row) for row in rows]
-    elapsed = (time.time() - start) * 1000
+    _store_count(key, total)
+    return rows, total
+
+
+async def _count(db, base_from, where_sql, params) -> int:
+    """Count all rows matching a filter set."""
+    cursor = await db.execute(f"SELECT COUNT(*) as cnt {base_from} WHERE {where_sql}", params)
+    row = await cursor.fetchone()
+    return row[0] if row else 0
 
-    return jobs, total, round(elapsed, 2)
+
+# ── Cursor pagination ───────────────────────────────────────────
+
+def _encode_cursor(posted_at, job_id: str) -> str:
+    """Encode a (posted_at, id) keyset position as an opaque token."""
+    raw = json.dumps([posted_at, job_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(token: str) -> tuple:
+    """Decode a cursor token back to (posted_at, id)."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        posted_at, job_id = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise SearchParamError("Invalid cursor") from e
+    if not isinstance(job_id, str) or not isinstance(posted_at, (str, int, float, type(None))):
+        raise SearchParamError("Invalid cursor")
+    return posted_at, job_id
+
+
+def _keyset_clause(after: tuple) -> Tuple[str, list]:
+    """WHERE clause for rows after a cursor under posted_at DESC, id DESC (NULLs last)."""
+    posted_at, job_id = after
+    if posted_at is None:
+        return "(j.posted_at IS NULL AND j.id < ?)", [job_id]
+    return "((j.posted_at, j.id) < (?, ?) OR j.posted_at IS NULL)", [posted_at, job_id]
+
+
+def _next_cursor(rows, limit: int, order_by: str) -> Optional[str]:
+    """Cursor for the page after this one, when it may exist and keyset order applies."""
+    if len(rows) < limit or not order_by.startswith("j.posted_at"):
+        return None
+    last = rows[-1]
+    return _encode_cursor(last["posted_at"], last["id"])
 
 
 def _add_filters(where_clauses, params, title, location, location_type,
                  company, skills, salary_min, salary_max, experience_min,
                  experience_max, category, employment_type, posted_after):
-    """Add SQL WHERE filters."""
+    """Add SQL WHERE filters.
+
+    LIKE is already case-insensitive in SQLite, and the exact-match filters
+    compare with NOCASE so they can use the NOCASE indexes; no LOWER() wrapping.
+    Skills match canonical names exactly through the job_skills table.
+    """
     if title:
-        where_clauses.append("LOWER(j.title) LIKE ?")
+        where_clauses.append("j.title LIKE ?")
         params.append(f"%{title.lower()}%")
 
     if location:
-        where_clauses.append("LOWER(j.location) LIKE ?")
+        where_clauses.append("j.location LIKE ?")
         params.append(f"%{location.lower()}%")
 
     if location_type:
-        where_clauses.append("LOWER(j.location_type) = ?")
+        where_clauses.append("j.location_type = ? COLLATE NOCASE")
         params.append(location_type.lower())
 
     if company:
-        where_clauses.append("LOWER(c.name) LIKE ?")
+        where_clauses.append("c.name LIKE ?")
         params.append(f"%{company.lower()}%")
 
     if skills:
-        for skill in skills:
-            where_clauses.append("LOWER(j.skills) LIKE ?")
-            params.append(f"%{skill.lower()}%")
+        # Jobs carrying every requested skill, via the (skill, job_id) index
+        wanted = sorted({normalize_skill(skill) for skill in skills} - {""})
+        if wanted:
+            placeholders = ",".join("?" * len(wanted))
+            where_clauses.append(f"""j.id IN (
+                SELECT job_id FROM job_skills WHERE skill IN ({placeholders})
+                GROUP BY job_id HAVING COUNT(*) = ?
+            )""")
+            params.extend(wanted)
+            params.append(len(wanted))
 
     if salary_min is not None:
         where_clauses.append("(j.salary_max >= ? OR j.salary_max IS NULL)")
@@ -200,11 +426,11 @@ def _add_filters(where_clauses, params, title, location, location_type,
         params.append(experience_max)
 
     if category:
-        where_clauses.append("LOWER(j.category) = ?")
+        where_clauses.append("j.category = ? COLLATE NOCASE")
         params.append(category.lower())
 
     if employment_type:
-        where_clauses.append("LOWER(j.employment_type) = ?")
+        where_clauses.append("j.employment_type = ? COLLATE NOCASE")
         params.append(employment_type.lower())
 
     if posted_after:
@@ -217,79 +443,147 @@ def _get_order_by(sort: str, has_fts: bool = False) -> str:
     if sort == "relevance" and has_fts:
         return "fts.rank"
     elif sort == "posted_at":
-        return "j.posted_at DESC"
+        return "j.posted_at DESC, j.id DESC"
     elif sort == "salary":
         return "j.salary_max DESC"
     else:
-        return "j.posted_at DESC"
+        return "j.posted_at DESC, j.id DESC"
 
 
-def _row_to_job(row) -> dict:
-    """Convert a database row to a job dict."""
-    skills_raw = row["skills"] if row["skills"] else "[]"
+@lru_cache(maxsize=4096)
+def _parse_skills_json(raw: Optional[str]) -> tuple:
+    """Decode a stored skills JSON array (cached; job rows rarely change)."""
     try:
-        skills_list = json.loads(skills_raw)
+        return tuple(json.loads(raw or "[]"))
     except (json.JSONDecodeError, TypeError):
-        skills_list = []
-
-    salary_range = None
-    if row["salary_min"] and row["salary_max"]:
-        salary_range = f"\u20b9{row['salary_min']:,} - \u20b9{row['salary_max']:,}/month"
-    elif row["salary_min"]:
-        salary_range = f"\u20b9{row['salary_min']:,}+/month"
-    elif row["salary_max"]:
-        salary_range = f"Up to \u20b9{row['salary_max']:,}/month"
-
-    experience = None
-    if row["experience_min"] is not None and row["experience_max"] is not None:
-        experience = f"{row['experience_min']}-{row['experience_max']} years"
-    elif row["experience_min"] is not None:
-        experience = f"{row['experience_min']}+ years"
-    elif row["experience_max"] is not None:
-        experience = f"0-{row['experience_max']} years"
+        return ()
+
 
+# Display formats keyed by which bounds are present
+SALARY_FMT = {
+    (True, True): "\u20b9{0:,} - \u20b9{1:,}/month",
+    (True, False): "\u20b9{0:,}+/month",
+    (False, True): "Up to \u20b9{1:,}/month",
+    (False, False): None,
+}
+EXPERIENCE_FMT = {
+    (True, True): "{0}-{1} years",
+    (True, False): "{0}+ years",
+    (False, True): "0-{1} years",
+    (False, False): None,
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_salary(salary_min: Optional[int], salary_max: Optional[int]) -> Optional[str]:
+    """Human-readable monthly salary range (a zero bound counts as unknown)."""
+    fmt = SALARY_FMT[bool(salary_min), bool(salary_max)]
+    return fmt and fmt.format(salary_min, salary_max)
+
+
+@lru_cache(maxsize=1024)
+def _format_experience(experience_min: Optional[int], experience_max: Optional[int]) -> Optional[str]:
+    """Human-readable experience range."""
+    fmt = EXPERIENCE_FMT[experience_min is not None, experience_max is not None]
+    return fmt and fmt.format(experience_min, experience_max)
+
+
+# Row columns _job_dict takes, in its argument order
+_JOB_FIELDS = (
+    "id", "title", "company_name", "company_industry", "company_size",
+    "location", "location_type", "salary_min", "salary_max",
+    "experience_min", "experience_max", "skills", "category", "employment_type",
+    "description", "description_short", "posted_at", "apply_url", "source",
+    "salary_text", "source_id", "scraped_at", "is_active",
+)
+
+
+@lru_cache(maxsize=16)
+def _job_getter(columns: tuple) -> itemgetter:
+    """Positional getter pulling _JOB_FIELDS out of rows with this column layout."""
+    index = {name: i for i, name in enumerate(columns)}
+    return itemgetter(*(index[name] for name in _JOB_FIELDS))
+
+
+def _rows_to_jobs(rows) -> List[dict]:
+    """Convert database rows (one shared column layout) to job dicts."""
+    if not rows:
+        return []
+    get = _job_getter(tuple(rows[0].keys()))
+    return [_job_dict(*get(row)) for row in rows]
+
+
+def _row_to_job(row) -> dict:
+    """Convert a database row to a job dict."""
+    return _rows_to_jobs([row])[0]
+
+
+def _job_dict(job_id, title, company_name, company_industry, company_size,
+              location, location_type, salary_min, salary_max,
+              experience_min, experience_max, skills, category, employment_type,
+              description, description_short, posted_at, apply_url, source,
+              salary_text, source_id, scraped_at, is_active) -> dict:
     return {
-        "id": row["id"],
-        "title": row["title"],
+        "id": job_id,
+        "title": title,
         "company": {
-            "name": row["company_name"] or "Unknown",
-            "industry": row["company_industry"],
-            "size": row["company_size"],
+            "name": company_name or "Unknown",
+            "industry": company_industry,
+            "size": company_size,
         },
-        "location": row["location"],
-        "location_type": row["location_type"],
-        "salary_range": salary_range,
-        "salary_min": row["salary_min"],
-        "salary_max": row["salary_max"],
-        "experience": experience,
-        "experience_min": row["experience_min"],
-        "experience_max": row["experience_max"],
-        "skills": skills_list,
-        "category": row["category"],
-        "employment_type": row["employment_type"],
-        "description": row["description"],
-        "description_short": row["description_short"],
-        "posted_at": row["posted_at"],
-        "apply_url": row["apply_url"],
-        "source": row["source"],
-        "salary_text": row["salary_text"],
-        "source_id": row["source_id"],
-        "scraped_at": row["scraped_at"],
-        "is_active": bool(row["is_active"]),
+        "location": location,
+        "location_type": location_type,
+        "salary_range": _format_salary(salary_min, salary_max),
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "experience": _format_experience(experience_min, experience_max),
+        "experience_min": experience_min,
+        "experience_max": experience_max,
+        "skills": list(_parse_skills_json(skills)),
+        "category": category,
+        "employment_type": employment_type,
+        "description": description,
+        "description_short": description_short,
+        "posted_at": posted_at,
+        "apply_url": apply_url,
+        "source": source,
+        "salary_text": salary_text,
+        "source_id": source_id,
+        "scraped_at": scraped_at,
+        "is_active": bool(is_active),
     }
 
 
 async def get_job_by_id(job_id: str) -> Optional[dict]:
     """Get a single job by ID."""
-    db = await get_db()
-    cursor = await db.execute("""
-        SELECT j.*, c.name as company_name, c.industry as company_industry,
-               c.size as company_size
-        FROM jobs j
-        LEFT JOIN companies c ON j.company_id = c.id
-        WHERE j.id = ?
-    """, [job_id])
-    row = await cursor.fetchone()
+    async with read_db() as db:
+        cursor = await db.execute("""
+            SELECT j.*, c.name as company_name, c.industry as company_industry,
+                   c.size as company_size
+            FROM jobs j
+            LEFT JOIN companies c ON j.company_id = c.id
+            WHERE j.id = ?
+        """, [job_id])
+        row = await cursor.fetchone()
     if not row:
         return None
     return _row_to_job(row)
+
+
+async def get_jobs_by_ids(job_ids: List[str]) -> List[Optional[dict]]:
+    """Get several jobs in one query, in input order (None for unknown IDs)."""
+    unique_ids = list(dict.fromkeys(job_ids))
+    if not unique_ids:
+        return []
+    placeholders = ",".join("?" * len(unique_ids))
+    async with read_db() as db:
+        cursor = await db.execute(f"""
+            SELECT j.*, c.name as company_name, c.industry as company_industry,
+                   c.size as company_size
+            FROM jobs j
+            LEFT JOIN companies c ON j.company_id = c.id
+            WHERE j.id IN ({placeholders})
+        """, unique_ids)
+        rows = await cursor.fetchall()
+    by_id = {job["id"]: job for job in _rows_to_jobs(rows)}
+    return [dict(by_id[job_id]) if job_id in by_id else None for job_id in job_ids]
@@ -1,7 +1,10 @@
 """Skills extraction and normalization for AgentJobs."""
 
+import hashlib
 import re
-from typing import List, Set
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, List, Set, Tuple
 
 # Canonical skill mappings (variations -> canonical name)
 SKILL_ALIASES = {
@@ -193,6 +196,11 @@ def normalize_skill(skill: str) -> str:
 
 def normalize_skills(skills: List[str]) -> List[str]:
     """Normalize a list of skills, removing duplicates."""
+    return list(_normalize_skills_cached(tuple(skills)))
+
+
+@lru_cache(maxsize=2048)
+def _normalize_skills_cached(skills: tuple) -> tuple:
     seen = set()
     result = []
     for skill in skills:
@@ -200,64 +208,160 @@ def normalize_skills(skills: List[str]) -> List[str]:
         if normalized and normalized not in seen:
             seen.add(normalized)
             result.append(normalized)
-    return result
+    return tuple(result)
+
+
+# Fixed bit per canonical skill, in sorted order; never extended
+_CANONICAL_SKILLS = sorted(set(SKILL_ALIASES.values()))
+_CANONICAL_BITS = {s: i for i, s in enumerate(_CANONICAL_SKILLS)}
+
+# Bit position per skill. Canonical skills get the low bits up front; free-form
+# tags from stored jobs are appended the first time a job carrying them is
+# encoded. Request input never allocates bits, so the table is bounded by the
+# job data rather than by what clients send.
+_SKILL_BITS = dict(_CANONICAL_BITS)
+
+
+def job_skills_to_mask(skills: Iterable[str]) -> int:
+    """Encode a stored job's (normalized) skills as a bitmask, registering new tags."""
+    mask = 0
+    for skill in skills:
+        bit = _SKILL_BITS.get(skill)
+        if bit is None:
+            bit = _SKILL_BITS[skill] = len(_SKILL_BITS)
+        mask |= 1 << bit
+    return mask
+
+
+def skills_to_mask(skills: Iterable[str]) -> int:
+    """Encode normalized skills as a bitmask, skipping skills no job has registered."""
+    mask = 0
+    for skill in skills:
+        bit = _SKILL_BITS.get(skill)
+        if bit is not None:
+            mask |= 1 << bit
+    return mask
+
+
+class KeywordScan:
+    """Finds every keyword occurring in a text (overlaps included) with one regex pass.
+
+    The regex is a lookahead union, so finditer tries every position: the
+    longest keyword wins at a position, and a prefix map adds the shorter
+    keywords that match at the same spot. With word_bounded, keywords must
+    also start and end on word boundaries.
+    """
+
+    def __init__(self, keywords: Iterable[str], word_bounded: bool = False):
+        kws = sorted(set(keywords), key=len, reverse=True)
+        edge = r"\b" if word_bounded else ""
+        self.rx = re.compile(f"(?={edge}(" + "|".join(map(re.escape, kws)) + f"){edge})")
+        self.prefixes = {
+            k: [p for p in kws
+                if p == k or (k.startswith(p) and (not word_bounded or re.match(edge + re.escape(p) + edge, k)))]
+            for k in kws
+        }
+
+    def hits(self, text: str) -> Set[str]:
+        return {p for m in self.rx.finditer(text) for p in self.prefixes[m.group(1)]}
+
+
+# Extraction tables, built once. Multi-word keys (spaces, "/" or ".") match as
+# plain substrings. Single-word keys need word boundaries: a pure \w+ key is
+# then exactly one \w+ token of the text, so those are set lookups, and only
+# the few keys with symbols (c++, c#, scikit-learn) go through a scan.
+_MULTI_WORD_KEYS = [k for k in SKILL_ALIASES if " " in k or "/" in k or "." in k]
+# Skip very short keys to avoid false positives
+_SINGLE_WORD_KEYS = [k for k in SKILL_ALIASES if k not in _MULTI_WORD_KEYS and (len(k) > 1 or k in ("r", "c"))]
+_TOKEN_RE = re.compile(r"\w+")
+_TOKEN_KEYS = frozenset(k for k in _SINGLE_WORD_KEYS if _TOKEN_RE.fullmatch(k))
+_MULTI_WORD_SCAN = KeywordScan(_MULTI_WORD_KEYS)
+_SYMBOL_WORD_SCAN = KeywordScan((k for k in _SINGLE_WORD_KEYS if k not in _TOKEN_KEYS), word_bounded=True)
+
+
+# Recent extraction results keyed by a digest of the text, so resumes
+# themselves are never held in memory
+EXTRACT_CACHE_SIZE = 256
+_extract_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
 
 
 def extract_skills_from_text(text: str) -> List[str]:
     """Extract skills from free-form text (resume, job description, etc.)."""
     if not text:
         return []
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    found = _extract_cache.get(key)
+    if found is None:
+        found = _scan_skills(text)
+        _extract_cache[key] = found
+        if len(_extract_cache) > EXTRACT_CACHE_SIZE:
+            _extract_cache.popitem(last=False)
+    else:
+        _extract_cache.move_to_end(key)
+    return list(found)
+
 
+def _scan_skills(text: str) -> tuple:
     text_lower = text.lower()
     found: Set[str] = set()
 
-    # Multi-word skills first (longer matches take priority)
-    multi_word = sorted(
-        [k for k in SKILL_ALIASES.keys() if " " in k or "/" in k or "." in k],
-        key=len,
-        reverse=True,
-    )
-    for skill_key in multi_word:
-        if skill_key in text_lower:
-            found.add(SKILL_ALIASES[skill_key])
-
-    # Single-word skills (use word boundary matching)
-    single_word = [k for k in SKILL_ALIASES.keys() if " " not in k and "/" not in k and "." not in k]
-    for skill_key in single_word:
-        # Skip very short keys to avoid false positives
-        if len(skill_key) <= 1 and skill_key not in ("r", "c"):
-            continue
-        pattern = r'\b' + re.escape(skill_key) + r'\b'
-        if re.search(pattern, text_lower):
-            found.add(SKILL_ALIASES[skill_key])
-
-    return sorted(list(found))
+    for skill_key in _MULTI_WORD_SCAN.hits(text_lower):
+        found.add(SKILL_ALIASES[skill_key])
+
+    for skill_key in _TOKEN_KEYS.intersection(_TOKEN_RE.findall(text_lower)):
+        found.add(SKILL_ALIASES[skill_key])
+
+    for skill_key in _SYMBOL_WORD_SCAN.hits(text_lower):
+        found.add(SKILL_ALIASES[skill_key])
+
+    return tuple(sorted(found))
+
+
+def _split_skills(skills: List[str]) -> Tuple[int, Set[str]]:
+    """Normalize skills into a canonical-skill bitmask plus a set of the rest."""
+    mask = 0
+    rest = set()
+    for s in skills:
+        skill = normalize_skill(s)
+        bit = _CANONICAL_BITS.get(skill)
+        if bit is None:
+            rest.add(skill)
+        else:
+            mask |= 1 << bit
+    return mask, rest
+
+
+def _canonical_names(mask: int) -> List[str]:
+    """Decode a canonical-skill bitmask to its names (sorted, as bits are)."""
+    names = []
+    while mask:
+        low = mask & -mask
+        names.append(_CANONICAL_SKILLS[low.bit_length() - 1])
+        mask ^= low
+    return names
 
 
 def skills_similarity(skills_a: List[str], skills_b: List[str]) -> float:
     """Calculate similarity between two skill sets (0-1)."""
     if not skills_a or not skills_b:
         return 0.0
-    set_a = set(normalize_skill(s) for s in skills_a)
-    set_b = set(normalize_skill(s) for s in skills_b)
-    intersection = set_a & set_b
-    union = set_a | set_b
-    if not union:
-        return 0.0
-    return len(intersection) / len(union)
+    mask_a, rest_a = _split_skills(skills_a)
+    mask_b, rest_b = _split_skills(skills_b)
+    intersection = (mask_a & mask_b).bit_count() + len(rest_a & rest_b)
+    union = (mask_a | mask_b).bit_count() + len(rest_a | rest_b)
+    return intersection / union
 
 
 def skills_match_details(candidate_skills: List[str], job_skills: List[str]) -> dict:
     """Get detailed match info between candidate and job skills."""
-    c_set = set(normalize_skill(s) for s in candidate_skills)
-    j_set = set(normalize_skill(s) for s in job_skills)
-    matched = c_set & j_set
-    missing = j_set - c_set
-    extra = c_set - j_set
-    match_pct = len(matched) / len(j_set) * 100 if j_set else 0
+    c_mask, c_rest = _split_skills(candidate_skills)
+    j_mask, j_rest = _split_skills(job_skills)
+    matched = _canonical_names(c_mask & j_mask) + list(c_rest & j_rest)
+    j_size = j_mask.bit_count() + len(j_rest)
+    match_pct = len(matched) / j_size * 100 if j_size else 0
     return {
-        "matched": sorted(list(matched)),
-        "missing": sorted(list(missing)),
-        "extra": sorted(list(extra)),
+        "matched": sorted(matched),
+        "missing": sorted(_canonical_names(j_mask & ~c_mask) + list(j_rest - c_rest)),
+        "extra": sorted(_canonical_names(c_mask & ~j_mask) + list(c_rest - j_rest)),
         "match_percentage": round(match_pct, 1),
     }